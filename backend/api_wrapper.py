@@ -1,27 +1,50 @@
 """Wrapper for comic generation pipeline with user-provided API keys."""
 
+import os
 import sys
+import json
+import shutil
 import asyncio
+import hashlib
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
+import httpx
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.analysis.normalizer import StoryNormalizer
-from src.analysis.analyzer import NarrativeAnalyzer
-from src.assets.templates import CharacterTemplateManager
-from src.assets.generator import ImageGenerator
-from src.panels.breakdown import PanelBreakdown
-from src.compositor.layout import PageCompositor
-from src.compositor.export import ComicExporter
 from src.utils.logger import get_logger
 
 from backend.jobs import JobManager, JobStatus
+from src.utils.config import get_config
+from src.utils.ratelimit import AsyncTokenBucket, TokenBucket, estimate_tokens
 
 logger = get_logger("stripsmith.api_wrapper")
 
+# Max character sheets generated concurrently (each is an independent image API call)
+CHARACTER_CONCURRENCY = int(os.getenv("CHARACTER_CONCURRENCY", "10"))
+
+# Max panel images generated concurrently
+PANEL_CONCURRENCY = int(os.getenv("PANEL_CONCURRENCY", "8"))
+
+# Character sheets are reused across jobs, keyed by content hash
+CHAR_SHEET_CACHE_DIR = Path("data/cache/char_sheets")
+
+# Opt-in: reuse the analysis of a near-identical (not just identical) story.
+# Costs an embedding request per job; matches must share paragraph structure.
+SEMANTIC_ANALYSIS_CACHE = os.getenv("SEMANTIC_ANALYSIS_CACHE", "").lower() in ("1", "true", "yes")
+
+# Minimum story embedding similarity to reuse a cached analysis
+ANALYSIS_CACHE_THRESHOLD = float(os.getenv("ANALYSIS_CACHE_THRESHOLD", "0.98"))
+
+# Account rate limits, throttled proactively (raise for higher usage tiers).
+# TEXT_TPM overrides the config's analysis.tpm, which the CLI uses.
+IMAGE_RPM = int(os.getenv("IMAGE_RPM", "500"))
+TEXT_TPM = int(os.getenv("TEXT_TPM") or get_config().get("analysis.tpm", 40000))
+
 
 class ComicGenerator:
     """Wrapper for the comic generation pipeline that accepts user API keys."""
@@ -31,7 +54,9 @@ class ComicGenerator:
         openai_api_key: str,
         anthropic_api_key: str,
         job_manager: JobManager,
-        job_id: str
+        job_id: str,
+        http_client: httpx.AsyncClient,
+        sync_http_client: Optional[httpx.Client] = None
     ):
         """
         Initialize comic generator with user-provided API keys.
@@ -41,12 +66,24 @@ class ComicGenerator:
             anthropic_api_key: User's Anthropic API key
             job_manager: Job manager instance
             job_id: Current job ID
+            http_client: App-wide async HTTP client (owned by the caller)
+            sync_http_client: App-wide HTTP client for the sync Claude clients
         """
         self.openai_key = openai_api_key
         self.anthropic_key = anthropic_api_key
         self.job_manager = job_manager
         self.job_id = job_id
 
+        # Connection pools shared across jobs; API clients are per job only
+        # because each carries the user's key
+        self.http_client = http_client
+        self.sync_http_client = sync_http_client
+
+        self.image_bucket = AsyncTokenBucket(IMAGE_RPM, IMAGE_RPM)
+        # One blocking bucket for every Claude call in the job: PanelBreakdown
+        # takes from it on its worker threads, async code via asyncio.to_thread
+        self.text_bucket = TokenBucket(TEXT_TPM, TEXT_TPM)
+
         self.temp_dir = Path("data/temp") / job_id
         self.temp_dir.mkdir(parents=True, exist_ok=True)
 
@@ -54,37 +91,55 @@ class ComicGenerator:
 
     async def generate_comic(
         self,
-        story_text: str,
+        story_path: str,
         style: Optional[str] = None,
         chapters: str = "all",
-        output_format: str = "pdf"
+        output_format: str = "pdf",
+        batch_mode: bool = False
     ) -> Path:
         """
         Run the complete comic generation pipeline.
 
         Args:
-            story_text: Story content
+            story_path: Path to the story text file
             style: Art style (optional)
             chapters: Chapters to process (e.g., "1-3" or "all")
             output_format: Output format (pdf, png, cbz)
+            batch_mode: Break down chapters and generate panels via the
+                Anthropic/OpenAI batch APIs (half price, may take an hour or more)
 
         Returns:
             Path to generated comic file
         """
+        # Pipeline modules pull in PIL, reportlab and the API SDKs; import
+        # them only when a job runs so API startup stays fast
+        from src.analysis.normalizer import StoryNormalizer
+        from src.analysis.analyzer import NarrativeAnalyzer
+        from src.assets.templates import CharacterTemplateManager
+        from src.assets.generator import ImageGenerator
+        from src.panels.breakdown import PanelBreakdown
+        from src.compositor.layout import PageCompositor
+        from src.compositor.export import ComicExporter
+        from src.compositor.pages import PagePlan
+
+        # Sync callbacks (some on worker threads) post progress back to this loop
+        self._loop = asyncio.get_running_loop()
+
         try:
             # Stage 0: Normalize story
-            self._update_progress(5, "Normalizing story text...")
+            await self._update_progress(5, "Normalizing story text...")
+            story_text = Path(story_path).read_text(encoding='utf-8')
             normalizer = StoryNormalizer()
             normalized = normalizer.normalize(story_text)
             logger.info(f"Story normalized: {normalized['metadata']['word_count']} words")
 
             # Stage 1: Analyze story
-            self._update_progress(10, "Analyzing story structure with Claude...")
-            analyzer = NarrativeAnalyzer(api_key=self.anthropic_key)
-            project_spec = analyzer.analyze(
-                normalized['text'],
-                user_style=style
+            await self._update_progress(10, "Analyzing story structure with Claude...")
+            analyzer = NarrativeAnalyzer(
+                api_key=self.anthropic_key,
+                async_http_client=self.http_client
             )
+            project_spec = await self._cached_analysis(analyzer, normalized['text'], style)
 
             # Save project spec
             spec_path = self.temp_dir / "project_spec.json"
@@ -92,60 +147,114 @@ class ComicGenerator:
             logger.info(f"Found {len(project_spec['chapters'])} chapters, {len(project_spec['characters'])} characters")
 
             # Stage 2: Generate character sheets
-            self._update_progress(20, f"Generating character reference sheets ({len(project_spec['characters'])} characters)...")
+            await self._update_progress(20, f"Generating character reference sheets ({len(project_spec['characters'])} characters)...")
             template_manager = CharacterTemplateManager()
             template_manager.create_all_templates(project_spec)
 
-            generator = ImageGenerator(api_key=self.openai_key)
+            generator = ImageGenerator(
+                api_key=self.openai_key,
+                async_http_client=self.http_client
+            )
             char_output_dir = self.temp_dir / "character_sheets"
 
-            for i, character in enumerate(project_spec['characters']):
+            characters = project_spec['characters']
+            sem = asyncio.Semaphore(CHARACTER_CONCURRENCY)
+
+            async def _gen_char(character):
                 char_name = character['name']
-                progress = 20 + int((i / len(project_spec['characters'])) * 10)
-                self._update_progress(progress, f"Generating character sheet: {char_name}...")
 
                 # Create prompts
                 prompts = template_manager.create_character_sheet_prompts(char_name)
 
+                # Reuse a sheet generated from identical inputs by an earlier job
+                cache_key = hashlib.sha256(json.dumps(
+                    {"char": character, "style": project_spec.get('style', {}), "prompts": prompts},
+                    sort_keys=True
+                ).encode()).hexdigest()
+                char_dir = generator.character_sheet_dir(str(char_output_dir), char_name)
+
+                if self._load_cached_sheet(cache_key, char_dir):
+                    logger.info(f"Character sheet cache hit: {char_name}")
+                    return char_name
+
                 # Generate images
-                await asyncio.to_thread(
-                    generator.generate_character_sheet,
-                    character_name=char_name,
-                    prompts=prompts,
-                    output_dir=str(char_output_dir)
-                )
+                async with sem:
+                    await self.image_bucket.acquire(len(prompts))
+                    generated = await generator.generate_character_sheet_async(
+                        character_name=char_name,
+                        prompts=prompts,
+                        output_dir=str(char_output_dir)
+                    )
+
+                # Only cache complete sheets
+                if len(generated) == len(prompts):
+                    self._store_cached_sheet(cache_key, char_dir)
+                return char_name
+
+            tasks = [asyncio.create_task(_gen_char(c)) for c in characters]
+            for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+                char_name = await task
+                progress = 20 + int((done / len(characters)) * 10)
+                await self._update_progress(progress, f"Character sheet complete: {char_name} ({done}/{len(characters)})")
 
             logger.info(f"Character sheets complete. Cost: ${generator.get_total_cost():.2f}")
 
             # Stage 3: Break down chapters into panels
-            self._update_progress(35, "Breaking chapters into panels...")
-            panel_breakdown = PanelBreakdown()
+            await self._update_progress(35, "Breaking chapters into panels...")
+            panel_breakdown = PanelBreakdown(
+                api_key=self.anthropic_key,
+                http_client=self.sync_http_client,
+                rate_limiter=self.text_bucket
+            )
 
             # Process specified chapters
             chapters_to_process = project_spec['chapters']
             if chapters and chapters != 'all':
+                chapters_by_num = {c['number']: c for c in chapters_to_process}
+
+                # Parse chapter range
                 if '-' in chapters:
                     start, end = map(int, chapters.split('-'))
-                    chapters_to_process = [c for c in chapters_to_process if start <= c['number'] <= end]
+                    requested_nums = range(start, end + 1)
                 else:
-                    chapter_num = int(chapters)
-                    chapters_to_process = [c for c in chapters_to_process if c['number'] == chapter_num]
+                    requested_nums = [int(chapters)]
+
+                chapters_to_process = [chapters_by_num[n] for n in requested_nums if n in chapters_by_num]
 
-            all_breakdowns = []
-            for i, chapter in enumerate(chapters_to_process):
-                progress = 35 + int((i / len(chapters_to_process)) * 10)
-                self._update_progress(progress, f"Processing chapter {chapter['number']}...")
+            if batch_mode:
+                def _on_batch_poll(processed, total):
+                    progress = 35 + int((processed / max(total, 1)) * 10)
+                    self._post_progress(progress, f"Batch processing chapters ({processed}/{total})...")
 
-                breakdown = panel_breakdown.breakdown_chapter(
-                    chapter,
+                all_breakdowns = await asyncio.to_thread(
+                    panel_breakdown.breakdown_chapters_batch,
+                    chapters_to_process,
                     story_text,
-                    project_spec
+                    project_spec,
+                    on_poll=_on_batch_poll
                 )
-                all_breakdowns.append(breakdown)
 
-                # Save breakdown
-                breakdown_path = self.temp_dir / f"chapter_{chapter['number']}_panels.json"
-                panel_breakdown.save_breakdown(breakdown, str(breakdown_path))
+                panel_breakdown.save_all(all_breakdowns, str(self.temp_dir))
+
+            else:
+                all_breakdowns = []
+                for i, chapter in enumerate(chapters_to_process):
+                    progress = 35 + int((i / len(chapters_to_process)) * 10)
+                    await self._update_progress(progress, f"Processing chapter {chapter['number']}...")
+
+                    # Sync Claude client with blocking retries and rate limiting;
+                    # keep it off the event loop
+                    breakdown = await asyncio.to_thread(
+                        panel_breakdown.breakdown_chapter,
+                        chapter,
+                        story_text,
+                        project_spec
+                    )
+                    all_breakdowns.append(breakdown)
+
+                    # Save breakdown
+                    breakdown_path = self.temp_dir / f"chapter_{chapter['number']}_panels.json"
+                    panel_breakdown.save_breakdown(breakdown, str(breakdown_path))
 
             total_panels = sum(
                 sum(len(page['panels']) for page in bd['pages'])
@@ -154,76 +263,79 @@ class ComicGenerator:
             logger.info(f"Created {total_panels} panels across {len(all_breakdowns)} chapters")
 
             # Stage 4: Generate panel images
-            self._update_progress(50, f"Generating panel images ({total_panels} panels)...")
+            await self._update_progress(50, f"Generating panel images ({total_panels} panels)...")
 
             panels_dir = self.temp_dir / "panels"
             panels_dir.mkdir(exist_ok=True)
 
-            # Build character prompt map
-            character_prompts = template_manager.templates
-            character_prompts = {name: t['base_prompt'] for name, t in character_prompts.items()}
+            # Build character prompt map once; shared read-only by every panel task
+            character_prompts = MappingProxyType({
+                name: t['base_prompt'] for name, t in template_manager.templates.items()
+            })
 
-            panel_count = 0
-            for breakdown in all_breakdowns:
-                chapter_num = breakdown['chapter_number']
+            pages_dir = self.temp_dir / "pages"
+            pages_dir.mkdir(exist_ok=True)
 
-                for page in breakdown['pages']:
-                    for panel in page['panels']:
-                        panel_num = panel['global_panel_num']
-                        panel_count += 1
+            # Panel numbers restart per chapter; the plan names files uniquely
+            plan = PagePlan(all_breakdowns, panels_dir, pages_dir)
+            panel_jobs = plan.panel_jobs
 
-                        progress = 50 + int((panel_count / total_panels) * 40)
-                        self._update_progress(progress, f"Generating panel {panel_count}/{total_panels}...")
+            if batch_mode:
+                def _on_poll(completed, total):
+                    progress = 50 + int((completed / max(total, 1)) * 40)
+                    self._post_progress(progress, f"Batch generating panels ({completed}/{total})...")
+
+                await generator.generate_panels_batch_async(
+                    panel_jobs,
+                    character_prompts,
+                    on_poll=_on_poll
+                )
 
-                        output_path = panels_dir / f"panel_{panel_num:03d}.png"
+            else:
+                sem = asyncio.Semaphore(PANEL_CONCURRENCY)
+                panel_count = 0
 
-                        await asyncio.to_thread(
-                            generator.generate_panel,
+                async def _gen_panel(panel, output_path):
+                    nonlocal panel_count
+                    async with sem:
+                        await self.image_bucket.acquire(1)
+                        result = await generator.generate_panel_async(
                             panel_data=panel,
                             character_prompts=character_prompts,
                             output_path=str(output_path)
                         )
 
+                    panel_count += 1
+                    progress = 50 + int((panel_count / total_panels) * 40)
+                    await self._update_progress(progress, f"Generated panel {panel_count}/{total_panels}...")
+                    return result
+
+                # A failed panel cancels the rest instead of paying for them
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        for panel, output_path, _ in panel_jobs:
+                            tg.create_task(_gen_panel(panel, output_path))
+                except ExceptionGroup as eg:
+                    raise eg.exceptions[0] from None
+
             logger.info(f"All panels generated! Total cost: ${generator.get_total_cost():.2f}")
 
             # Stage 5: Compose pages
-            self._update_progress(92, "Composing comic pages...")
+            await self._update_progress(92, "Composing comic pages...")
             compositor = PageCompositor()
             exporter = ComicExporter()
 
-            pages_dir = self.temp_dir / "pages"
-            pages_dir.mkdir(exist_ok=True)
-
-            composed_pages = []
-
-            for breakdown in all_breakdowns:
-                chapter_num = breakdown['chapter_number']
-
-                for page in breakdown['pages']:
-                    page_num = page['page_number']
-
-                    # Get panel images for this page
-                    panel_images = [
-                        str(panels_dir / f"panel_{p['global_panel_num']:03d}.png")
-                        for p in page['panels']
-                    ]
-
-                    # Compose page
-                    output_path = pages_dir / f"chapter_{chapter_num}_page_{page_num}.png"
-
-                    await asyncio.to_thread(
-                        compositor.compose_page,
-                        page_data=page,
-                        panel_images=panel_images,
-                        output_path=str(output_path)
-                    )
-
-                    composed_pages.append(str(output_path))
+            # Pillow releases the GIL while decoding, resizing and encoding, so
+            # threads compose pages in parallel and keep the app's log handlers
+            composed_pages = await asyncio.gather(*(
+                asyncio.to_thread(compositor.compose_page, page, images, out)
+                for page, images, out in plan.page_jobs
+            ))
 
             logger.info(f"Composed {len(composed_pages)} pages")
 
             # Export final comic
-            self._update_progress(97, f"Exporting to {output_format.upper()}...")
+            await self._update_progress(97, f"Exporting to {output_format.upper()}...")
             output_dir = Path("data/output") / self.job_id
             output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -254,7 +366,7 @@ class ComicGenerator:
                     output_path=str(output_file)
                 )
 
-            self._update_progress(100, "Complete!")
+            await self._update_progress(100, "Complete!")
             logger.info(f"Comic generation complete: {output_file}")
             logger.info(f"Total cost: ${generator.get_total_cost():.2f}")
 
@@ -264,12 +376,106 @@ class ComicGenerator:
             logger.error(f"Comic generation failed: {e}", exc_info=True)
             raise
 
-    def _update_progress(self, progress: int, stage: str):
+    async def _cached_analysis(
+        self,
+        analyzer: "NarrativeAnalyzer",
+        text: str,
+        style: Optional[str],
+    ) -> dict:
+        """
+        Analyze the story, reusing the spec of an earlier identical story.
+
+        With SEMANTIC_ANALYSIS_CACHE set, a near-identical story with the
+        same paragraph structure is also accepted.
+        """
+        cached = await asyncio.to_thread(analyzer.load_cached, text, style)
+        if cached is not None:
+            return cached
+
+        if not SEMANTIC_ANALYSIS_CACHE:
+            await asyncio.to_thread(self.text_bucket.acquire, estimate_tokens(text, 4096))
+            return await analyzer.analyze_async(text, user_style=style)
+
+        from openai import AsyncOpenAI
+        from backend.cache import SemanticCache, embed_text, paragraph_lengths
+
+        model = analyzer.config.get("analysis.llm_model", "")
+        lengths = paragraph_lengths(text)
+        cache = None
+        embedding = None
+
+        try:
+            cache = await asyncio.to_thread(SemanticCache)
+            embed_client = AsyncOpenAI(api_key=self.openai_key, http_client=self.http_client)
+            embedding = await embed_text(embed_client, text)
+            cached = await asyncio.to_thread(
+                cache.search, embedding, lengths, style, model, threshold=ANALYSIS_CACHE_THRESHOLD
+            )
+            if cached is not None:
+                return cached
+        except Exception as e:
+            logger.warning(f"Analysis cache lookup failed: {e}")
+
+        await asyncio.to_thread(self.text_bucket.acquire, estimate_tokens(text, 4096))
+        project_spec = await analyzer.analyze_async(text, user_style=style)
+
+        if cache is not None and embedding is not None:
+            try:
+                await asyncio.to_thread(cache.insert, lengths, embedding, style, model, project_spec)
+            except Exception as e:
+                logger.warning(f"Failed to cache analysis: {e}")
+
+        return project_spec
+
+    def _load_cached_sheet(self, cache_key: str, char_dir: Path) -> bool:
+        """
+        Link a cached character sheet into this job's temp dir.
+
+        Returns:
+            True on cache hit
+        """
+        cached_dir = CHAR_SHEET_CACHE_DIR / cache_key
+        if not cached_dir.is_dir():
+            return False
+
+        char_dir.mkdir(parents=True, exist_ok=True)
+        for cached_file in cached_dir.iterdir():
+            target = char_dir / cached_file.name
+            try:
+                # Hardlink: no copy, no extra disk space
+                os.link(cached_file, target)
+            except FileExistsError:
+                pass
+            except OSError:
+                shutil.copy2(cached_file, target)
+
+        return True
+
+    def _store_cached_sheet(self, cache_key: str, char_dir: Path):
+        """Copy a freshly generated character sheet into the cache."""
+        cached_dir = CHAR_SHEET_CACHE_DIR / cache_key
+        if cached_dir.exists():
+            return
+
+        # Copy to a private dir then rename, so readers never see a partial sheet
+        tmp_dir = CHAR_SHEET_CACHE_DIR / f".{cache_key}.{self.job_id}"
+        try:
+            shutil.copytree(char_dir, tmp_dir)
+            os.replace(tmp_dir, cached_dir)
+        except OSError as e:
+            logger.warning(f"Failed to cache character sheet: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    async def _update_progress(self, progress: int, stage: str):
         """Update job progress."""
-        self.job_manager.update_job_status(
+        await self.job_manager.update_job_status(
             self.job_id,
             JobStatus.PROCESSING,
             progress=progress,
             stage=stage
         )
         logger.info(f"[{progress}%] {stage}")
+
+    def _post_progress(self, progress: int, stage: str):
+        """Schedule a progress update from a sync callback (any thread)."""
+        asyncio.run_coroutine_threadsafe(self._update_progress(progress, stage), self._loop)
@@ -0,0 +1,199 @@
+"""Semantic cache for story analysis results."""
+
+import json
+import math
+import sqlite3
+from array import array
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from openai import AsyncOpenAI
+
+from src.utils.logger import get_logger
+
+logger = get_logger("stripsmith.cache")
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# ~6k tokens per chunk keeps each input under the embedding model's limit
+EMBED_CHUNK_CHARS = 24000
+
+# A semantic match must have every paragraph within this many characters
+# (or PARAGRAPH_LENGTH_TOLERANCE of its length, if larger) of the new story's
+PARAGRAPH_LENGTH_SLACK = 40
+PARAGRAPH_LENGTH_TOLERANCE = 0.1
+
+
+def paragraph_lengths(text: str) -> List[int]:
+    """
+    Get the length of each '\\n\\n'-separated paragraph.
+
+    Project specs index chapters by paragraph, so a cached spec only fits
+    a story whose paragraphs line up with the one it was made from.
+    """
+    return [len(para) for para in text.split('\n\n')]
+
+
+async def embed_text(client: AsyncOpenAI, text: str) -> List[float]:
+    """
+    Embed a (possibly novel-length) text as one unit vector.
+
+    The text is split into chunks that are embedded in a single request
+    and averaged, so the whole story contributes to the vector.
+
+    Args:
+        client: OpenAI async client
+        text: Text to embed
+
+    Returns:
+        Normalized embedding vector
+    """
+    chunks = [
+        text[i:i + EMBED_CHUNK_CHARS]
+        for i in range(0, len(text), EMBED_CHUNK_CHARS)
+    ] or [""]
+
+    response = await client.embeddings.create(model=EMBEDDING_MODEL, input=chunks)
+
+    dims = len(response.data[0].embedding)
+    mean = [0.0] * dims
+    for item in response.data:
+        for i, value in enumerate(item.embedding):
+            mean[i] += value
+
+    norm = math.sqrt(sum(v * v for v in mean)) or 1.0
+    return [v / norm for v in mean]
+
+
+class SemanticCache:
+    """
+    Cache project specs for reuse on near-identical stories.
+
+    Identical stories are already served by NarrativeAnalyzer's own file
+    cache; this one matches by embedding. Entries are only matched against
+    others with the same art style and analysis model, since both change
+    the resulting spec, and the same paragraph structure, so chapter
+    paragraph indices still line up.
+    """
+
+    def __init__(self, db_path: str = "data/cache/analysis.sqlite3"):
+        """
+        Initialize semantic cache.
+
+        Args:
+            db_path: SQLite database path
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_specs ("
+                " id INTEGER PRIMARY KEY,"
+                " style TEXT NOT NULL,"
+                " model TEXT NOT NULL,"
+                " paragraph_count INTEGER NOT NULL,"
+                " paragraph_lengths BLOB NOT NULL,"
+                " embedding BLOB NOT NULL,"
+                " project_spec TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS analysis_specs_structure"
+                " ON analysis_specs (style, model, paragraph_count)"
+            )
+
+    def search(
+        self,
+        embedding: List[float],
+        lengths: Sequence[int],
+        style: Optional[str],
+        model: str,
+        threshold: float = 0.98
+    ) -> Optional[Dict]:
+        """
+        Find the most similar cached project spec with the same structure.
+
+        Args:
+            embedding: Normalized story embedding
+            lengths: paragraph_lengths of the story
+            style: User-specified art style (None for inferred)
+            model: Analysis model name
+            threshold: Minimum cosine similarity for a hit
+
+        Returns:
+            Cached project spec, or None on miss
+        """
+        best_score = threshold
+        best_spec = None
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT embedding, paragraph_lengths, project_spec FROM analysis_specs"
+                " WHERE style = ? AND model = ? AND paragraph_count = ?",
+                (style or "", model, len(lengths))
+            )
+
+            for blob, lengths_blob, spec_json in rows:
+                cached_lengths = array('I')
+                cached_lengths.frombytes(lengths_blob)
+                if not self._same_structure(lengths, cached_lengths):
+                    continue
+
+                cached = array('f')
+                cached.frombytes(blob)
+                score = sum(a * b for a, b in zip(embedding, cached))
+
+                if score >= best_score:
+                    best_score = score
+                    best_spec = spec_json
+
+        if best_spec is None:
+            return None
+
+        logger.info(f"Analysis cache hit (similarity {best_score:.4f})")
+        return json.loads(best_spec)
+
+    def insert(
+        self,
+        lengths: Sequence[int],
+        embedding: List[float],
+        style: Optional[str],
+        model: str,
+        project_spec: Dict
+    ):
+        """
+        Store a project spec under its story embedding and structure.
+
+        Args:
+            lengths: paragraph_lengths of the story
+            embedding: Normalized story embedding
+            style: User-specified art style (None for inferred)
+            model: Analysis model name
+            project_spec: Project spec to cache
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO analysis_specs (style, model, paragraph_count,"
+                " paragraph_lengths, embedding, project_spec)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    style or "", model, len(lengths), array('I', lengths).tobytes(),
+                    array('f', embedding).tobytes(), json.dumps(project_spec)
+                )
+            )
+
+    @staticmethod
+    def _same_structure(lengths: Sequence[int], cached_lengths: Sequence[int]) -> bool:
+        """Whether two stories' paragraphs correspond one-to-one in length."""
+        if len(lengths) != len(cached_lengths):
+            return False
+
+        return all(
+            abs(a - b) <= max(PARAGRAPH_LENGTH_SLACK, PARAGRAPH_LENGTH_TOLERANCE * max(a, b))
+            for a, b in zip(lengths, cached_lengths)
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the cache database."""
+        return sqlite3.connect(self.db_path)
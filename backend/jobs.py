@@ -3,7 +3,11 @@
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Dict, Any, Optional
+import asyncio
+import json
+import os
 import threading
+import time
 
 
 class JobStatus(str, Enum):
@@ -20,8 +24,16 @@ class JobManager:
 
     Sessions store API keys (never persisted to disk).
     Jobs track comic generation progress.
+    Sessions are deleted by a timer when their TTL elapses. Jobs are only
+    deleted once finished and untouched for a TTL, so long batch-mode jobs
+    keep their status. Expiry math uses time.monotonic(); datetimes are
+    kept only for display.
     """
 
+    TTL = timedelta(hours=2)
+
+    _TERMINAL_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED)
+
     def __init__(self):
         """Initialize job manager."""
         self._sessions: Dict[str, Dict[str, Any]] = {}
@@ -29,7 +41,7 @@ class JobManager:
         self._lock = threading.Lock()
 
     # Session management
-    def create_session(
+    async def create_session(
         self,
         session_id: str,
         openai_key: Optional[str] = None,
@@ -50,14 +62,16 @@ class JobManager:
             session = {
                 "session_id": session_id,
                 "created_at": datetime.utcnow(),
-                "expires_at": datetime.utcnow() + timedelta(hours=2),
+                "expires_at_mono": time.monotonic() + self.TTL.total_seconds(),
                 "openai_key": openai_key,
                 "anthropic_key": anthropic_key,
             }
             self._sessions[session_id] = session
-            return session
 
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        self._schedule_expiry(self.TTL.total_seconds(), self._delete_session, session_id)
+        return session
+
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
         Get session by ID.
 
@@ -74,19 +88,23 @@ class JobManager:
                 return None
 
             # Check expiration
-            if datetime.utcnow() > session["expires_at"]:
+            if time.monotonic() > session["expires_at_mono"]:
                 del self._sessions[session_id]
                 return None
 
             return session
 
-    def delete_session(self, session_id: str):
+    async def delete_session(self, session_id: str):
         """
         Delete a session and its API keys.
 
         Args:
             session_id: Session identifier
         """
+        self._delete_session(session_id)
+
+    def _delete_session(self, session_id: str):
+        """Delete a session and clear its API keys (also run by the expiry timer)."""
         with self._lock:
             if session_id in self._sessions:
                 # Clear keys before deletion
@@ -95,15 +113,16 @@ class JobManager:
                 del self._sessions[session_id]
 
     # Job management
-    def create_job(
+    async def create_job(
         self,
         job_id: str,
         session_id: str,
-        story_text: str,
+        story_path: str,
         story_filename: str,
         style: Optional[str] = None,
         chapters: str = "all",
-        output_format: str = "pdf"
+        output_format: str = "pdf",
+        batch_mode: bool = False
     ) -> Dict[str, Any]:
         """
         Create a new job.
@@ -111,36 +130,43 @@ class JobManager:
         Args:
             job_id: Unique job identifier
             session_id: Session ID (for API keys)
-            story_text: Story content
+            story_path: Path to the uploaded story file
             story_filename: Original filename
             style: Art style
             chapters: Chapters to process
             output_format: Output format
+            batch_mode: Use the Anthropic/OpenAI batch APIs
 
         Returns:
             Job data
         """
+        now = time.monotonic()
+
         with self._lock:
             job = {
                 "job_id": job_id,
                 "session_id": session_id,
-                "story_text": story_text,
+                "story_path": story_path,
                 "story_filename": story_filename,
                 "style": style,
                 "chapters": chapters,
                 "output_format": output_format,
+                "batch_mode": batch_mode,
                 "status": JobStatus.PENDING,
                 "progress": 0,
                 "stage": "Initializing...",
                 "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
+                "created_at_mono": now,
+                "updated_at_mono": now,
                 "result": None,
                 "error": None,
             }
             self._jobs[job_id] = job
-            return job
 
-    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        self._schedule_expiry(self.TTL.total_seconds(), self._expire_job, job_id)
+        return job
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
         Get job by ID.
 
@@ -153,7 +179,7 @@ class JobManager:
         with self._lock:
             return self._jobs.get(job_id)
 
-    def update_job_status(
+    async def update_job_status(
         self,
         job_id: str,
         status: JobStatus,
@@ -179,7 +205,7 @@ class JobManager:
                 return
 
             job["status"] = status
-            job["updated_at"] = datetime.utcnow()
+            job["updated_at_mono"] = time.monotonic()
 
             if progress is not None:
                 job["progress"] = progress
@@ -193,7 +219,7 @@ class JobManager:
             if error is not None:
                 job["error"] = error
 
-    def delete_job(self, job_id: str):
+    async def delete_job(self, job_id: str):
         """
         Delete a job.
 
@@ -204,40 +230,79 @@ class JobManager:
             if job_id in self._jobs:
                 del self._jobs[job_id]
 
-    def cleanup_old_jobs(self, max_age_hours: int = 2):
+    def _expire_job(self, job_id: str):
+        """
+        Delete a job if it has expired, otherwise check again later.
+
+        Running jobs are never deleted; finished ones are kept for a TTL
+        after their last update.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job:
+                return
+
+            idle = time.monotonic() - job["updated_at_mono"]
+            ttl = self.TTL.total_seconds()
+
+            if job["status"] in self._TERMINAL_STATUSES and idle >= ttl:
+                del self._jobs[job_id]
+                return
+
+            delay = ttl - idle if job["status"] in self._TERMINAL_STATUSES else ttl
+
+        self._schedule_expiry(delay, self._expire_job, job_id)
+
+    def _schedule_expiry(self, delay: float, expire, item_id: str):
         """
-        Remove jobs older than specified hours.
+        Schedule an expiry callback for a job/session after delay seconds.
+
+        Outside an event loop nothing is scheduled; expired sessions are
+        still rejected by get_session and cleanup_old_jobs can be called
+        manually.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        loop.call_later(delay, expire, item_id)
+
+    async def cleanup_old_jobs(self, max_age_hours: int = 2):
+        """
+        Remove finished jobs idle for longer than specified hours, and expired sessions.
+
+        Only needed outside an event loop, where no expiry timers run.
 
         Args:
-            max_age_hours: Maximum age in hours
+            max_age_hours: Maximum hours since a finished job's last update
         """
         with self._lock:
-            cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
-            jobs_to_delete = [
+            now = time.monotonic()
+            cutoff = now - max_age_hours * 3600
+
+            for job_id in [
                 job_id
                 for job_id, job in self._jobs.items()
-                if job["created_at"] < cutoff
-            ]
-
-            for job_id in jobs_to_delete:
+                if job["status"] in self._TERMINAL_STATUSES and job["updated_at_mono"] < cutoff
+            ]:
                 del self._jobs[job_id]
 
-            # Also cleanup expired sessions
-            sessions_to_delete = [
+            for session_id in [
                 session_id
                 for session_id, session in self._sessions.items()
-                if session["expires_at"] < datetime.utcnow()
-            ]
-
-            for session_id in sessions_to_delete:
-                self.delete_session(session_id)
+                if session["expires_at_mono"] < now
+            ]:
+                session = self._sessions.pop(session_id)
+                session["openai_key"] = None
+                session["anthropic_key"] = None
 
-    def get_all_jobs(self) -> Dict[str, Dict[str, Any]]:
+    async def get_all_jobs(self) -> Dict[str, Dict[str, Any]]:
         """Get all jobs (for debugging)."""
         with self._lock:
             return dict(self._jobs)
 
-    def get_all_sessions(self) -> Dict[str, Dict[str, Any]]:
+    async def get_all_sessions(self) -> Dict[str, Dict[str, Any]]:
         """Get all sessions (for debugging, keys redacted)."""
         with self._lock:
             # Redact API keys for safety
@@ -249,3 +314,203 @@ class JobManager:
                 }
                 for sid, session in self._sessions.items()
             }
+
+    async def close(self):
+        """Nothing to release for in-memory state."""
+
+
+class RedisJobManager:
+    """
+    Manages jobs and sessions in Redis.
+
+    Same awaitable interface as JobManager, but state is shared across uvicorn
+    workers and survives restarts. Each job/session is a Redis hash
+    expired by TTL, so no lock or periodic cleanup scan is needed. A job's
+    TTL restarts on every update, so jobs that are still reporting progress
+    (including batch-mode jobs polling for hours) never expire.
+    Sessions still hold API keys; run Redis without persistence if keys
+    must never reach disk.
+    """
+
+    TTL_SECONDS = 7200  # 2 hours
+
+    _DATETIME_FIELDS = ("created_at", "updated_at", "expires_at")
+
+    def __init__(self, url: str):
+        """
+        Initialize Redis job manager.
+
+        Args:
+            url: Redis connection URL (e.g., redis://localhost:6379/0)
+        """
+        import redis.asyncio
+
+        self._redis = redis.asyncio.Redis.from_url(url, decode_responses=True)
+
+    # Session management
+    async def create_session(
+        self,
+        session_id: str,
+        openai_key: Optional[str] = None,
+        anthropic_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a new session (see JobManager.create_session)."""
+        now = datetime.utcnow()
+        session = {
+            "session_id": session_id,
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=self.TTL_SECONDS),
+            "openai_key": openai_key,
+            "anthropic_key": anthropic_key,
+        }
+        await self._put(f"session:{session_id}", session)
+        return session
+
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get session by ID, or None if not found/expired."""
+        return await self._get(f"session:{session_id}")
+
+    async def delete_session(self, session_id: str):
+        """Delete a session and its API keys."""
+        await self._redis.delete(f"session:{session_id}")
+
+    # Job management
+    async def create_job(
+        self,
+        job_id: str,
+        session_id: str,
+        story_path: str,
+        story_filename: str,
+        style: Optional[str] = None,
+        chapters: str = "all",
+        output_format: str = "pdf",
+        batch_mode: bool = False
+    ) -> Dict[str, Any]:
+        """Create a new job (see JobManager.create_job)."""
+        now = datetime.utcnow()
+        job = {
+            "job_id": job_id,
+            "session_id": session_id,
+            "story_path": story_path,
+            "story_filename": story_filename,
+            "style": style,
+            "chapters": chapters,
+            "output_format": output_format,
+            "batch_mode": batch_mode,
+            "status": JobStatus.PENDING,
+            "progress": 0,
+            "stage": "Initializing...",
+            "created_at": now,
+            "updated_at": now,
+            "result": None,
+            "error": None,
+        }
+        await self._put(f"job:{job_id}", job)
+        return job
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job by ID, or None if not found."""
+        job = await self._get(f"job:{job_id}")
+        if job:
+            job["status"] = JobStatus(job["status"])
+        return job
+
+    async def update_job_status(
+        self,
+        job_id: str,
+        status: JobStatus,
+        progress: Optional[int] = None,
+        stage: Optional[str] = None,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ):
+        """Update job status (see JobManager.update_job_status)."""
+        key = f"job:{job_id}"
+        if not await self._redis.exists(key):
+            return
+
+        fields = {"status": status, "updated_at": datetime.utcnow()}
+
+        if progress is not None:
+            fields["progress"] = progress
+
+        if stage is not None:
+            fields["stage"] = stage
+
+        if result is not None:
+            fields["result"] = result
+
+        if error is not None:
+            fields["error"] = error
+
+        await self._put(key, fields)
+
+    async def delete_job(self, job_id: str):
+        """Delete a job."""
+        await self._redis.delete(f"job:{job_id}")
+
+    async def cleanup_old_jobs(self, max_age_hours: int = 2):
+        """No-op: Redis expires jobs and sessions by TTL."""
+
+    async def get_all_jobs(self) -> Dict[str, Dict[str, Any]]:
+        """Get all jobs (for debugging)."""
+        return {
+            key.split(":", 1)[1]: await self._get(key)
+            async for key in self._redis.scan_iter("job:*")
+        }
+
+    async def get_all_sessions(self) -> Dict[str, Dict[str, Any]]:
+        """Get all sessions (for debugging, keys redacted)."""
+        sessions = {}
+        async for key in self._redis.scan_iter("session:*"):
+            session = await self._get(key)
+            if session:
+                sessions[key.split(":", 1)[1]] = {
+                    **session,
+                    "openai_key": "***" if session.get("openai_key") else None,
+                    "anthropic_key": "***" if session.get("anthropic_key") else None,
+                }
+        return sessions
+
+    async def close(self):
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
+
+    async def _put(self, key: str, data: Dict[str, Any]):
+        """Store (or update) fields of a record as a hash and restart its TTL."""
+        async with self._redis.pipeline() as pipe:
+            pipe.hset(key, mapping=self._encode(data))
+            pipe.expire(key, self.TTL_SECONDS)
+            await pipe.execute()
+
+    async def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a record stored by _put, or None if missing/expired."""
+        raw = await self._redis.hgetall(key)
+        if not raw:
+            return None
+
+        data = {field: json.loads(value) for field, value in raw.items()}
+        for field in self._DATETIME_FIELDS:
+            if data.get(field):
+                data[field] = datetime.fromisoformat(data[field])
+        return data
+
+    @staticmethod
+    def _encode(data: Dict[str, Any]) -> Dict[str, str]:
+        """JSON-encode hash field values (datetimes as ISO strings)."""
+        return {
+            field: json.dumps(value.isoformat() if isinstance(value, datetime) else value)
+            for field, value in data.items()
+        }
+
+
+def create_job_manager():
+    """
+    Create the job manager for this process.
+
+    Uses Redis when REDIS_URL is set, otherwise in-memory state.
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        return RedisJobManager(redis_url)
+    return JobManager()
@@ -1,9 +1,9 @@
 """FastAPI backend for StripSmith web app."""
 
+import importlib.util
 import os
 import sys
 import uuid
-import asyncio
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -12,48 +12,53 @@ from fastapi import FastAPI, HTTPException, UploadFile, File, Form, BackgroundTa
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
+import httpx
 import uvicorn
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from backend.jobs import JobManager, JobStatus
-from backend.api_wrapper import ComicGenerator
+from backend.jobs import JobStatus, create_job_manager
 
 # Initialize FastAPI app
 app = FastAPI(title="StripSmith API", version="1.0.0")
 
-# CORS configuration - allow Vercel frontend
+# CORS configuration - exact origins (comma-separated), e.g. the Vercel frontend.
+# A wildcard origin is invalid with credentials, so browsers would reject it.
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:5173").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:5173",
-        "https://*.vercel.app",
-        "*"  # For development - restrict in production
-    ],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
-# Job manager instance
-job_manager = JobManager()
+# Job manager instance (Redis-backed when REDIS_URL is set)
+job_manager = create_job_manager()
 
-# Cleanup old jobs periodically
-@app.on_event("startup")
-async def startup_event():
-    """Clean up old jobs on startup."""
-    asyncio.create_task(cleanup_old_jobs())
+# Uploaded stories are streamed here rather than held in memory
+UPLOAD_DIR = Path("data/temp/uploads")
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB
 
+# Connection limits for the app-wide HTTP clients shared by every job
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50)
 
-async def cleanup_old_jobs():
-    """Remove jobs older than 2 hours."""
-    while True:
-        await asyncio.sleep(600)  # Every 10 minutes
-        job_manager.cleanup_old_jobs(max_age_hours=2)
+# Multiplex concurrent Claude requests over one connection when h2 is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
+# Content types for generated comics, by file extension
+DOWNLOAD_MEDIA_TYPES = {
+    ".pdf": "application/pdf",
+    ".cbz": "application/vnd.comicbook+zip",
+}
 
 # Models
 class SetKeysRequest(BaseModel):
@@ -66,6 +71,25 @@ class GenerateRequest(BaseModel):
     style: Optional[str] = None
     chapters: Optional[str] = None
     format: str = "pdf"
+    batch_mode: bool = False
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Open the HTTP connection pools shared by all jobs."""
+    app.state.http_client = httpx.AsyncClient(limits=HTTP_LIMITS)
+    app.state.sync_http_client = httpx.Client(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared HTTP connection pools and the job store."""
+    from src.assets.generator import aclose_shared_clients
+
+    await app.state.http_client.aclose()
+    app.state.sync_http_client.close()
+    await aclose_shared_clients()
+    await job_manager.close()
 
 
 # Health check
@@ -95,7 +119,7 @@ async def create_session():
         session_id: Unique session identifier
     """
     session_id = str(uuid.uuid4())
-    job_manager.create_session(session_id)
+    await job_manager.create_session(session_id)
     return {
         "session_id": session_id,
         "expires_in": 7200  # 2 hours
@@ -123,7 +147,7 @@ async def set_keys(request: SetKeysRequest):
 
     # Create session and store keys
     session_id = str(uuid.uuid4())
-    job_manager.create_session(
+    await job_manager.create_session(
         session_id,
         openai_key=request.openai_api_key,
         anthropic_key=request.anthropic_api_key
@@ -144,7 +168,8 @@ async def generate_comic(
     story_file: UploadFile = File(...),
     style: Optional[str] = Form(None),
     chapters: Optional[str] = Form("all"),
-    output_format: str = Form("pdf")
+    output_format: str = Form("pdf"),
+    batch_mode: bool = Form(False)
 ):
     """
     Start comic generation job.
@@ -155,32 +180,38 @@ async def generate_comic(
         style: Art style (optional)
         chapters: Chapters to process (e.g., "1-3" or "all")
         output_format: Output format (pdf, png, cbz)
+        batch_mode: Use the Anthropic/OpenAI batch APIs (cheaper, slower)
 
     Returns:
         job_id: Job identifier for tracking progress
     """
     # Validate session
-    session = job_manager.get_session(session_id)
+    session = await job_manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=401, detail="Invalid or expired session")
 
     if not session.get("openai_key") or not session.get("anthropic_key"):
         raise HTTPException(status_code=400, detail="API keys not set for this session")
 
+    job_id = str(uuid.uuid4())
+
     # Save uploaded file
-    story_content = await story_file.read()
-    story_text = story_content.decode('utf-8')
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    story_path = UPLOAD_DIR / f"{job_id}.txt"
+    with open(story_path, 'wb') as f:
+        while chunk := await story_file.read(UPLOAD_CHUNK_SIZE):
+            f.write(chunk)
 
     # Create job
-    job_id = str(uuid.uuid4())
-    job_manager.create_job(
+    await job_manager.create_job(
         job_id=job_id,
         session_id=session_id,
-        story_text=story_text,
+        story_path=str(story_path),
         story_filename=story_file.filename,
         style=style,
         chapters=chapters,
-        output_format=output_format
+        output_format=output_format,
+        batch_mode=batch_mode
     )
 
     # Start background processing
@@ -198,35 +229,42 @@ async def generate_comic(
 
 async def process_comic_generation(job_id: str):
     """Background task to process comic generation."""
+    # Imported on first job so health checks and session endpoints
+    # don't wait on the pipeline's heavy dependencies at startup
+    from backend.api_wrapper import ComicGenerator
+
     try:
         # Get job and session
-        job = job_manager.get_job(job_id)
-        session = job_manager.get_session(job["session_id"])
+        job = await job_manager.get_job(job_id)
+        session = await job_manager.get_session(job["session_id"])
 
         if not job or not session:
             return
 
         # Update status
-        job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0)
+        await job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0)
 
         # Create generator with user's API keys
         generator = ComicGenerator(
             openai_api_key=session["openai_key"],
             anthropic_api_key=session["anthropic_key"],
             job_manager=job_manager,
-            job_id=job_id
+            job_id=job_id,
+            http_client=app.state.http_client,
+            sync_http_client=app.state.sync_http_client
         )
 
         # Run generation
         output_path = await generator.generate_comic(
-            story_text=job["story_text"],
+            story_path=job["story_path"],
             style=job.get("style"),
             chapters=job.get("chapters", "all"),
-            output_format=job.get("output_format", "pdf")
+            output_format=job.get("output_format", "pdf"),
+            batch_mode=job.get("batch_mode", False)
         )
 
         # Update job with result
-        job_manager.update_job_status(
+        await job_manager.update_job_status(
             job_id,
             JobStatus.COMPLETED,
             progress=100,
@@ -235,12 +273,16 @@ async def process_comic_generation(job_id: str):
 
     except Exception as e:
         # Update job with error
-        job_manager.update_job_status(
+        await job_manager.update_job_status(
             job_id,
             JobStatus.FAILED,
             error=str(e)
         )
 
+    finally:
+        # The uploaded story is only needed while the job runs
+        (UPLOAD_DIR / f"{job_id}.txt").unlink(missing_ok=True)
+
 
 @app.get("/api/status/{job_id}")
 async def get_job_status(job_id: str):
@@ -253,7 +295,7 @@ async def get_job_status(job_id: str):
     Returns:
         Job status, progress, and result/error if available
     """
-    job = job_manager.get_job(job_id)
+    job = await job_manager.get_job(job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -287,7 +329,7 @@ async def download_result(job_id: str):
     Returns:
         Generated comic file
     """
-    job = job_manager.get_job(job_id)
+    job = await job_manager.get_job(job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -298,13 +340,22 @@ async def download_result(job_id: str):
     result = job.get("result", {})
     output_path = result.get("output_path")
 
-    if not output_path or not Path(output_path).exists():
+    if not output_path:
         raise HTTPException(status_code=404, detail="Output file not found")
 
+    # Stat once here and hand it to FileResponse so it doesn't stat again
+    try:
+        stat_result = os.stat(output_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Output file not found")
+
+    output_path = Path(output_path)
+
     return FileResponse(
         output_path,
-        media_type="application/octet-stream",
-        filename=Path(output_path).name
+        media_type=DOWNLOAD_MEDIA_TYPES.get(output_path.suffix, "application/octet-stream"),
+        filename=output_path.name,
+        stat_result=stat_result
     )
 
 
@@ -316,7 +367,7 @@ async def cancel_job(job_id: str):
     Args:
         job_id: Job identifier
     """
-    job = job_manager.get_job(job_id)
+    job = await job_manager.get_job(job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -324,7 +375,7 @@ async def cancel_job(job_id: str):
     if job["status"] in [JobStatus.COMPLETED, JobStatus.FAILED]:
         raise HTTPException(status_code=400, detail="Job already finished")
 
-    job_manager.update_job_status(job_id, JobStatus.FAILED, error="Cancelled by user")
+    await job_manager.update_job_status(job_id, JobStatus.FAILED, error="Cancelled by user")
 
     return {"message": "Job cancelled"}
 
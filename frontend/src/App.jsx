@@ -18,6 +18,7 @@ function App() {
   const [style, setStyle] = useState('')
   const [chapters, setChapters] = useState('all')
   const [outputFormat, setOutputFormat] = useState('pdf')
+  const [batchMode, setBatchMode] = useState(false)
   const [uploadError, setUploadError] = useState('')
 
   // Progress
@@ -109,6 +110,7 @@ function App() {
       formData.append('style', style || '')
       formData.append('chapters', chapters)
       formData.append('output_format', outputFormat)
+      formData.append('batch_mode', batchMode)
 
       const response = await fetch(`${API_URL}/api/generate`, {
         method: 'POST',
@@ -247,6 +249,18 @@ function App() {
                 </select>
               </div>
 
+              <div className="form-group">
+                <label htmlFor="mode">Generation Mode</label>
+                <select
+                  id="mode"
+                  value={batchMode ? 'batch' : 'standard'}
+                  onChange={(e) => setBatchMode(e.target.value === 'batch')}
+                >
+                  <option value="standard">Standard</option>
+                  <option value="batch">Batch (50% cheaper, ~1h)</option>
+                </select>
+              </div>
+
               {uploadError && <div className="error">{uploadError}</div>}
               {error && <div className="error">{error}</div>}
 
@@ -4,6 +4,7 @@
 import sys
 import os
 import click
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -21,8 +22,10 @@ from src.assets.generator import ImageGenerator
 from src.panels.breakdown import PanelBreakdown
 from src.compositor.layout import PageCompositor
 from src.compositor.export import ComicExporter
+from src.compositor.pages import PagePlan
 from src.utils.logger import setup_logger, get_logger
 from src.utils.config import get_config
+from src.utils.fs import ensure_dir
 
 # Setup logger
 setup_logger(name="stripsmith", level="INFO", console=True)
@@ -43,7 +46,9 @@ def cli():
 @click.option('--chapters', default=None, help='Chapters to process (e.g., "1-3" or "all")')
 @click.option('--analyze-only', is_flag=True, help='Only analyze story, don\'t generate images')
 @click.option('--characters-only', is_flag=True, help='Only generate character sheets')
-def generate(story_file, style, output, format, chapters, analyze_only, characters_only):
+@click.option('--no-cache', is_flag=True, help='Re-analyze the story even if a cached analysis exists')
+@click.option('--batch', is_flag=True, help='Break down chapters and generate panels via the Batch APIs (half price, up to 24h)')
+def generate(story_file, style, output, format, chapters, analyze_only, characters_only, no_cache, batch):
     """
     Generate a comic from a story file.
 
@@ -71,8 +76,11 @@ def generate(story_file, style, output, format, chapters, analyze_only, characte
         analyzer = NarrativeAnalyzer()
         project_spec = analyzer.analyze(
             normalized['normalized_text'],
-            user_style=style
+            user_style=style,
+            use_cache=not no_cache,
+            on_progress=lambda chunk: click.echo(".", nl=False)
         )
+        click.echo()
 
         click.echo(f"  ✓ Found: {len(project_spec['chapters'])} chapters")
         click.echo(f"  ✓ Found: {len(project_spec['characters'])} characters")
@@ -81,7 +89,7 @@ def generate(story_file, style, output, format, chapters, analyze_only, characte
 
         # Save project spec
         temp_dir = Path("data/temp")
-        temp_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(temp_dir)
         spec_path = temp_dir / "project_spec.json"
         analyzer.save_project_spec(project_spec, str(spec_path))
         click.echo(f"  💾 Saved project spec: {spec_path}")
@@ -100,19 +108,30 @@ def generate(story_file, style, output, format, chapters, analyze_only, characte
 
         char_output_dir = temp_dir / "character_sheets"
 
-        for character in project_spec['characters']:
-            char_name = character['name']
-            click.echo(f"  Generating: {char_name}...")
+        characters = project_spec['characters']
 
-            # Create prompts
-            prompts = template_manager.create_character_sheet_prompts(char_name)
+        # Each sheet is a chain of network-bound API calls, so run them in parallel
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(characters)))) as executor:
+            futures = {}
+            for character in characters:
+                char_name = character['name']
+                click.echo(f"  Generating: {char_name}...")
 
-            # Generate images
-            generator.generate_character_sheet(
-                character_name=char_name,
-                prompts=prompts,
-                output_dir=str(char_output_dir)
-            )
+                # Create prompts
+                prompts = template_manager.create_character_sheet_prompts(char_name)
+
+                # Generate images
+                future = executor.submit(
+                    generator.generate_character_sheet,
+                    character_name=char_name,
+                    prompts=prompts,
+                    output_dir=str(char_output_dir)
+                )
+                futures[future] = char_name
+
+            for future in as_completed(futures):
+                future.result()
+                click.echo(f"  ✓ Done: {futures[future]}")
 
         click.echo(f"  ✓ Character sheets saved to: {char_output_dir}")
         click.echo(f"  💰 Cost so far: ${generator.get_total_cost():.2f}")
@@ -129,27 +148,53 @@ def generate(story_file, style, output, format, chapters, analyze_only, characte
         # Process specified chapters
         chapters_to_process = project_spec['chapters']
         if chapters and chapters != 'all':
+            chapters_by_num = {c['number']: c for c in chapters_to_process}
+
             # Parse chapter range
             if '-' in chapters:
                 start, end = map(int, chapters.split('-'))
-                chapters_to_process = [c for c in chapters_to_process if start <= c['number'] <= end]
+                requested_nums = range(start, end + 1)
             else:
-                chapter_num = int(chapters)
-                chapters_to_process = [c for c in chapters_to_process if c['number'] == chapter_num]
-
-        all_breakdowns = []
-        for chapter in chapters_to_process:
-            click.echo(f"  Processing chapter {chapter['number']}...")
-            breakdown = panel_breakdown.breakdown_chapter(
-                chapter,
-                normalized['raw_text'],
-                project_spec
-            )
-            all_breakdowns.append(breakdown)
+                requested_nums = [int(chapters)]
+
+            chapters_to_process = [chapters_by_num[n] for n in requested_nums if n in chapters_by_num]
+
+        # The raw story is only needed here, so re-read it rather than hold it since Stage 0
+        story_text = Path(normalized['source_path']).read_text(encoding='utf-8')
+
+        # Chapters are broken down concurrently; each is saved as it lands
+        with ThreadPoolExecutor(max_workers=4) as save_pool:
+            save_futures = []
+
+            def _on_chapter_complete(breakdown):
+                click.echo(f"  ✓ Chapter {breakdown['chapter_number']} broken down")
+
+                # Save breakdown
+                breakdown_path = temp_dir / f"chapter_{breakdown['chapter_number']}_panels.json"
+                save_futures.append(
+                    save_pool.submit(panel_breakdown.save_breakdown, breakdown, str(breakdown_path))
+                )
+
+            click.echo(f"  Processing {len(chapters_to_process)} chapters...")
+            if batch:
+                all_breakdowns = panel_breakdown.breakdown_chapters_batch(
+                    chapters_to_process,
+                    story_text,
+                    project_spec,
+                    on_poll=lambda done, total: click.echo(f"  ... {done}/{total} chapters")
+                )
+                for breakdown in all_breakdowns:
+                    _on_chapter_complete(breakdown)
+            else:
+                all_breakdowns = panel_breakdown.breakdown_all_chapters(
+                    project_spec,
+                    story_text,
+                    chapters=chapters_to_process,
+                    on_complete=_on_chapter_complete
+                )
 
-            # Save breakdown
-            breakdown_path = temp_dir / f"chapter_{chapter['number']}_panels.json"
-            panel_breakdown.save_breakdown(breakdown, str(breakdown_path))
+            for future in save_futures:
+                future.result()
 
         total_panels = sum(
             sum(len(page['panels']) for page in bd['pages'])
@@ -161,72 +206,92 @@ def generate(story_file, style, output, format, chapters, analyze_only, characte
 
         # Stage 4: Generate panel images
         click.echo("🎨 Stage 4: Generating panel images...")
-        click.echo(f"  (This will cost approximately ${total_panels * 0.04:.2f})")
+        panel_cost = 0.02 if batch else 0.04
+        click.echo(f"  (This will cost approximately ${total_panels * panel_cost:.2f})")
 
         if not click.confirm("  Continue with image generation?"):
             click.echo("  Cancelled. Run again when ready.")
             return
 
         panels_dir = temp_dir / "panels"
-        panels_dir.mkdir(exist_ok=True)
+        ensure_dir(panels_dir)
 
         # Build character prompt map
         character_prompts = template_manager.templates
         character_prompts = {name: t['base_prompt'] for name, t in character_prompts.items()}
 
-        for breakdown in all_breakdowns:
-            chapter_num = breakdown['chapter_number']
-
-            for page in breakdown['pages']:
-                for panel in page['panels']:
-                    panel_num = panel['global_panel_num']
-                    click.echo(f"  Generating panel {panel_num}...")
-
-                    output_path = panels_dir / f"panel_{panel_num:03d}.png"
-
-                    generator.generate_panel(
-                        panel_data=panel,
-                        character_prompts=character_prompts,
-                        output_path=str(output_path)
-                    )
-
-        click.echo(f"  ✓ All panels generated!")
-        click.echo(f"  💰 Total cost: ${generator.get_total_cost():.2f}")
-        click.echo()
-
-        # Stage 5: Compose pages
-        click.echo("📄 Stage 5: Composing comic pages...")
+        # Plan page composition up front so each page can be composed as
+        # soon as its own panels exist, while other panels are still generating
         compositor = PageCompositor()
         exporter = ComicExporter()
 
         pages_dir = temp_dir / "pages"
-        pages_dir.mkdir(exist_ok=True)
-
-        composed_pages = []
+        ensure_dir(pages_dir)
+
+        plan = PagePlan(all_breakdowns, panels_dir, pages_dir)
+        page_jobs = plan.page_jobs
+        panel_jobs = plan.panel_jobs
+        compose_futures = {}
+
+        # PageCompositor keeps no per-page state and Pillow releases the GIL,
+        # so pages (all at once in batch mode) compose in parallel
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as composer:
+            def _compose(page_idx):
+                page, panel_images, output_path = page_jobs[page_idx]
+                compose_futures[page_idx] = composer.submit(
+                    compositor.compose_page,
+                    page_data=page,
+                    panel_images=panel_images,
+                    output_path=output_path
+                )
 
-        for breakdown in all_breakdowns:
-            chapter_num = breakdown['chapter_number']
+            def _on_panel_complete(job, result):
+                bar.update(1)
+
+                _, _, page_idx = job
+                if plan.panel_done(page_idx):
+                    _compose(page_idx)
+
+            # Pages without panels have nothing to wait for
+            for page_idx, remaining in enumerate(plan.panels_remaining):
+                if remaining == 0:
+                    _compose(page_idx)
+
+            if batch:
+                # One offline job for every panel; pages are composed once it lands
+                click.echo("  Submitted to the OpenAI Batch API (can take up to 24h)...")
+                generator.generate_panels_batch_api(
+                    panel_jobs,
+                    character_prompts,
+                    on_poll=lambda done, total: click.echo(f"  ... {done}/{total} panels")
+                )
 
-            for page in breakdown['pages']:
-                page_num = page['page_number']
-                layout = page['layout']
+                for page_idx, remaining in enumerate(plan.panels_remaining):
+                    if remaining:
+                        _compose(page_idx)
 
-                # Get panel images for this page
-                panel_images = [
-                    str(panels_dir / f"panel_{p['global_panel_num']:03d}.png")
-                    for p in page['panels']
-                ]
+            else:
+                # Panels are independent API calls, so run processing.batch_size at a time.
+                # Completion callbacks run on this thread, so the bar needs no lock.
+                with click.progressbar(length=len(panel_jobs), label="  Generating panels") as bar:
+                    generator.generate_panels_batch(
+                        panel_jobs,
+                        character_prompts,
+                        max_workers=config.get("processing.batch_size", 5),
+                        on_complete=_on_panel_complete
+                    )
 
-                # Compose page
-                output_path = pages_dir / f"chapter_{chapter_num}_page_{page_num}.png"
+            click.echo(f"  ✓ All panels generated!")
+            click.echo(f"  💰 Total cost: ${generator.get_total_cost():.2f}")
+            click.echo()
 
-                compositor.compose_page(
-                    page_data=page,
-                    panel_images=panel_images,
-                    output_path=str(output_path)
-                )
+            # Stage 5: Compose pages (most are already done by now)
+            click.echo("📄 Stage 5: Composing comic pages...")
 
-                composed_pages.append(str(output_path))
+            composed_pages = [
+                compose_futures[page_idx].result()
+                for page_idx in range(len(page_jobs))
+            ]
 
         click.echo(f"  ✓ Composed {len(composed_pages)} pages")
         click.echo()
@@ -234,7 +299,7 @@ def generate(story_file, style, output, format, chapters, analyze_only, characte
         # Export final comic
         click.echo(f"📦 Exporting to {format.upper()}...")
         output_dir = Path(output)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(output_dir)
 
         story_name = Path(story_file).stem
 
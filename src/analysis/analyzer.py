@@ -1,77 +1,390 @@
 """Narrative analysis using Claude API (Stage 1)."""
 
+import asyncio
+import difflib
+import hashlib
 import json
+import math
 import os
-from typing import Dict, List, Optional
-from anthropic import Anthropic
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import httpx
+from anthropic import Anthropic, AsyncAnthropic
 
 from src.utils.logger import get_logger
 from src.utils.config import get_config
+from src.utils.fs import ensure_dir, write_atomic
+from src.utils import jsonio
 
 logger = get_logger("stripsmith.analyzer")
 
+# Project specs keyed by a hash of the story text, style and model
+ANALYSIS_CACHE_DIR = Path("data/cache/analysis")
+
+# Name similarity above which characters/environments from different
+# story parts are treated as the same entity
+MERGE_NAME_SIMILARITY = 0.85
+
 
 class NarrativeAnalyzer:
     """Analyze story structure and extract characters, scenes, and style using Claude."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize narrative analyzer.
 
         Args:
             api_key: Anthropic API key (uses ANTHROPIC_API_KEY env var if None)
+            http_client: Shared HTTP client to reuse pooled connections (optional)
+            async_http_client: Shared async HTTP client for analyze_async
+                (optional, owned by the caller)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment")
 
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = Anthropic(api_key=self.api_key, http_client=http_client)
+        self.async_http_client = async_http_client
+        self._async_client: Optional[AsyncAnthropic] = None
         self.config = get_config()
 
         logger.info("Narrative analyzer initialized")
 
-    def analyze(self, story_text: str, user_style: Optional[str] = None) -> Dict:
+    def analyze(
+        self,
+        story_text: str,
+        user_style: Optional[str] = None,
+        use_cache: bool = True,
+        on_progress: Optional[Callable[[str], None]] = None
+    ) -> Dict:
         """
         Analyze story and extract structure.
 
         Args:
             story_text: Normalized story text
             user_style: Optional user-specified art style
+            use_cache: Reuse the spec from an earlier run on the identical
+                story, style and model (also requires processing.cache_enabled)
+            on_progress: Optional callback receiving each chunk of the
+                response text as it streams in
 
         Returns:
             Project spec with chapters, characters, environments, style
         """
+        model = self.config.get("analysis.llm_model", "claude-3-5-sonnet-20250514")
+
+        cache_path = self._analysis_cache_path(story_text, user_style, model, use_cache)
+        if cache_path is not None and cache_path.exists():
+            logger.info(f"Analysis cache hit: {cache_path}")
+            return jsonio.load_file(cache_path)
+
         logger.info("Analyzing story structure...")
 
-        # Build analysis prompt
-        prompt = self._build_analysis_prompt(story_text, user_style)
+        try:
+            parts = self._split_story(
+                story_text,
+                self.config.get("analysis.max_prompt_chars", 150000)
+            )
+
+            if len(parts) == 1:
+                project_spec = self._request_analysis(
+                    self._build_analysis_prompt(story_text, user_style),
+                    model,
+                    on_progress
+                )
+            else:
+                # Too long for one prompt: analyze each part, then merge
+                logger.info(f"Story too long for one prompt, analyzing in {len(parts)} parts")
+                part_specs = []
+                for i, (offset, part_text) in enumerate(parts, start=1):
+                    logger.info(f"Analyzing part {i}/{len(parts)}...")
+                    prompt = self._build_analysis_prompt(part_text, user_style, part=(i, len(parts)))
+                    part_specs.append((offset, self._request_analysis(prompt, model, on_progress)))
+
+                project_spec = self._merge_part_specs(part_specs)
+
+            logger.info(f"Analysis complete: {len(project_spec['chapters'])} chapters, "
+                       f"{len(project_spec['characters'])} characters")
+
+            if cache_path is not None:
+                self._store_cached_spec(project_spec, cache_path)
+
+            return project_spec
+
+        except Exception as e:
+            logger.error(f"Analysis failed: {e}")
+            raise
+
+    async def analyze_async(
+        self,
+        story_text: str,
+        user_style: Optional[str] = None,
+        use_cache: bool = True,
+        on_progress: Optional[Callable[[str], None]] = None
+    ) -> Dict:
+        """
+        Analyze story and extract structure using the async Claude client.
+
+        Same arguments and return value as analyze, but requests never
+        block the event loop, and parts of a long story are analyzed
+        concurrently.
+        """
+        model = self.config.get("analysis.llm_model", "claude-3-5-sonnet-20250514")
+
+        cache_path = self._analysis_cache_path(story_text, user_style, model, use_cache)
+        if cache_path is not None and cache_path.exists():
+            logger.info(f"Analysis cache hit: {cache_path}")
+            return jsonio.load_file(cache_path)
+
+        logger.info("Analyzing story structure...")
 
-        # Call Claude API
         try:
-            response = self.client.messages.create(
-                model=self.config.get("analysis.llm_model", "claude-3-5-sonnet-20250514"),
-                max_tokens=4096,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
+            parts = self._split_story(
+                story_text,
+                self.config.get("analysis.max_prompt_chars", 150000)
             )
 
-            # Parse response
-            result_text = response.content[0].text
-            project_spec = self._parse_response(result_text)
+            if len(parts) == 1:
+                project_spec = await self._request_analysis_async(
+                    self._build_analysis_prompt(story_text, user_style),
+                    model,
+                    on_progress
+                )
+            else:
+                # Too long for one prompt: analyze each part, then merge
+                logger.info(f"Story too long for one prompt, analyzing in {len(parts)} parts")
+                part_results = await asyncio.gather(*(
+                    self._request_analysis_async(
+                        self._build_analysis_prompt(part_text, user_style, part=(i, len(parts))),
+                        model,
+                        on_progress
+                    )
+                    for i, (_, part_text) in enumerate(parts, start=1)
+                ))
+
+                project_spec = self._merge_part_specs([
+                    (offset, spec) for (offset, _), spec in zip(parts, part_results)
+                ])
 
             logger.info(f"Analysis complete: {len(project_spec['chapters'])} chapters, "
                        f"{len(project_spec['characters'])} characters")
 
+            if cache_path is not None:
+                self._store_cached_spec(project_spec, cache_path)
+
             return project_spec
 
         except Exception as e:
             logger.error(f"Analysis failed: {e}")
             raise
 
-    def _build_analysis_prompt(self, story_text: str, user_style: Optional[str]) -> str:
-        """Build the analysis prompt for Claude."""
+    def load_cached(self, story_text: str, user_style: Optional[str] = None) -> Optional[Dict]:
+        """
+        Get the spec an earlier run produced for the identical story.
+
+        Args:
+            story_text: Normalized story text
+            user_style: Optional user-specified art style
+
+        Returns:
+            Cached project spec, or None on miss or with caching off
+        """
+        model = self.config.get("analysis.llm_model", "claude-3-5-sonnet-20250514")
+
+        cache_path = self._analysis_cache_path(story_text, user_style, model, True)
+        if cache_path is None or not cache_path.exists():
+            return None
+
+        logger.info(f"Analysis cache hit: {cache_path}")
+        return jsonio.load_file(cache_path)
+
+    def _analysis_cache_path(
+        self,
+        story_text: str,
+        user_style: Optional[str],
+        model: str,
+        use_cache: bool
+    ) -> Optional[Path]:
+        """Get the cache file for an analysis, or None if caching is off."""
+        if not use_cache or not self.config.get("processing.cache_enabled", True):
+            return None
+
+        cache_key = hashlib.sha256(
+            "\0".join([model, user_style or "", story_text]).encode('utf-8')
+        ).hexdigest()
+        return ANALYSIS_CACHE_DIR / f"{cache_key}.json"
+
+    def _request_analysis(
+        self,
+        prompt: str,
+        model: str,
+        on_progress: Optional[Callable[[str], None]] = None
+    ) -> Dict:
+        """Send an analysis prompt to Claude and parse the project spec."""
+        # Stream the response so callers can show progress while Claude writes
+        chunks = []
+        with self.client.messages.stream(
+            model=model,
+            max_tokens=4096,
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }]
+        ) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+                if on_progress:
+                    on_progress(text)
+
+        # Parse response
+        return self._parse_response(''.join(chunks))
+
+    async def _request_analysis_async(
+        self,
+        prompt: str,
+        model: str,
+        on_progress: Optional[Callable[[str], None]] = None
+    ) -> Dict:
+        """Async variant of _request_analysis."""
+        chunks = []
+        async with self._get_async_client().messages.stream(
+            model=model,
+            max_tokens=4096,
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }]
+        ) as stream:
+            async for text in stream.text_stream:
+                chunks.append(text)
+                if on_progress:
+                    on_progress(text)
+
+        return self._parse_response(''.join(chunks))
+
+    def _get_async_client(self) -> AsyncAnthropic:
+        """Get the async Claude client, creating it on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncAnthropic(api_key=self.api_key, http_client=self.async_http_client)
+        return self._async_client
+
+    def _split_story(self, story_text: str, max_chars: int) -> List[Tuple[int, str]]:
+        """
+        Split a story into parts of at most max_chars on paragraph boundaries.
+
+        Args:
+            story_text: Normalized story text
+            max_chars: Maximum characters per part
+
+        Returns:
+            List of (first paragraph index, part text) tuples
+        """
+        if len(story_text) <= max_chars:
+            return [(0, story_text)]
+
+        parts = []
+        current = []
+        current_len = 0
+        offset = 0
+
+        for i, para in enumerate(story_text.split('\n\n')):
+            if current and current_len + len(para) > max_chars:
+                parts.append((offset, '\n\n'.join(current)))
+                current = []
+                current_len = 0
+                offset = i
+
+            current.append(para)
+            current_len += len(para) + 2
+
+        if current:
+            parts.append((offset, '\n\n'.join(current)))
+
+        return parts
+
+    def _merge_part_specs(self, part_specs: List[Tuple[int, Dict]]) -> Dict:
+        """
+        Merge project specs analyzed from consecutive story parts.
+
+        Chapters are renumbered and their paragraph indices shifted to the
+        whole story. Characters and environments seen in several parts are
+        deduplicated by fuzzy name match, keeping the first description.
+
+        Args:
+            part_specs: List of (first paragraph index, project spec) tuples
+
+        Returns:
+            Merged project spec
+        """
+        merged = {
+            "chapters": [],
+            "characters": [],
+            "environments": [],
+            "style": part_specs[0][1]["style"],
+        }
+
+        for offset, spec in part_specs:
+            for chapter in spec["chapters"]:
+                chapter = dict(chapter)
+                chapter["number"] = len(merged["chapters"]) + 1
+                for key in ("start_paragraph", "end_paragraph"):
+                    if isinstance(chapter.get(key), int):
+                        chapter[key] += offset
+                merged["chapters"].append(chapter)
+
+            for key in ("characters", "environments"):
+                for entity in spec[key]:
+                    if not self._find_similar(entity.get("name", ""), merged[key]):
+                        merged[key].append(entity)
+
+        return merged
+
+    def _find_similar(self, name: str, entities: List[Dict]) -> Optional[Dict]:
+        """Find an entity whose name closely matches name."""
+        name = name.lower()
+        for entity in entities:
+            ratio = difflib.SequenceMatcher(None, name, entity.get("name", "").lower()).ratio()
+            if ratio > MERGE_NAME_SIMILARITY:
+                return entity
+        return None
+
+    def _store_cached_spec(self, project_spec: Dict, cache_path: Path):
+        """Write a spec to the analysis cache atomically (best effort)."""
+        try:
+            ensure_dir(cache_path.parent)
+            write_atomic(cache_path, jsonio.dumps(project_spec))
+        except OSError as e:
+            logger.warning(f"Failed to cache analysis: {e}")
+
+    def _build_analysis_prompt(
+        self,
+        story_text: str,
+        user_style: Optional[str],
+        part: Optional[Tuple[int, int]] = None
+    ) -> str:
+        """
+        Build the analysis prompt for Claude.
+
+        Args:
+            story_text: Story text (or one part of it)
+            user_style: Optional user-specified art style
+            part: (part number, total parts) when analyzing a long story in parts
+        """
+        max_chapters = self.config.get('analysis.max_chapters', 50)
+
+        part_instruction = ""
+        if part:
+            part_num, total_parts = part
+            max_chapters = math.ceil(max_chapters / total_parts)
+            part_instruction = (
+                f"\n- This is part {part_num} of {total_parts} of a longer story; "
+                f"number paragraph indices from 0 at the start of this part"
+            )
 
         style_instruction = ""
         if user_style:
@@ -124,13 +437,13 @@ Please provide a JSON response with the following structure:
 }}
 
 Instructions:
-- Break the story into logical chapters/scenes (aim for {self.config.get('analysis.max_chapters', 50)} max)
+- Break the story into logical chapters/scenes (aim for {max_chapters} max)
 - Extract ALL named characters with detailed visual descriptions
 - Include recurring locations and environments
 {style_instruction}
 - Focus on VISUAL details that can be drawn (not personality traits unless they affect appearance)
 - For characters, be extremely specific about visual features (exact hair length, eye color, clothing items)
-- Use paragraph indices from the story text for chapter boundaries
+- Use paragraph indices from the story text for chapter boundaries{part_instruction}
 
 Return ONLY the JSON, no additional text."""
 
@@ -147,7 +460,7 @@ Return ONLY the JSON, no additional text."""
                 raise ValueError("No JSON found in response")
 
             json_text = response_text[json_start:json_end]
-            project_spec = json.loads(json_text)
+            project_spec = jsonio.loads(json_text)
 
             # Validate structure
             required_keys = ["chapters", "characters", "environments", "style"]
@@ -157,7 +470,7 @@ Return ONLY the JSON, no additional text."""
 
             return project_spec
 
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # Also raised by orjson (a subclass)
             logger.error(f"Failed to parse JSON response: {e}")
             logger.debug(f"Response text: {response_text}")
             raise
@@ -213,10 +526,11 @@ Return ONLY the JSON, no additional text."""
             output_path: Path to save JSON file
         """
         try:
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            ensure_dir(Path(output_path).parent)
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(project_spec, f, indent=2, ensure_ascii=False)
+            # Serialize straight to bytes and swap in atomically, so a crash
+            # mid-save never leaves a truncated spec behind
+            write_atomic(output_path, jsonio.dumps(project_spec, indent=True))
 
             logger.info(f"Project spec saved to: {output_path}")
 
@@ -235,8 +549,7 @@ Return ONLY the JSON, no additional text."""
             Project spec dict
         """
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                project_spec = json.load(f)
+            project_spec = jsonio.load_file(input_path)
 
             logger.info(f"Project spec loaded from: {input_path}")
             return project_spec
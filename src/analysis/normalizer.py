@@ -1,6 +1,7 @@
 """Story text normalization and cleaning (Stage 0)."""
 
 import re
+from collections import Counter
 from typing import Dict, List, Optional
 from pathlib import Path
 
@@ -14,13 +15,45 @@ class StoryNormalizer:
 
     def __init__(self):
         """Initialize story normalizer."""
+        # Smart and French quotes are converted to these by _normalize_quotes
+        # before dialogue is annotated, so only straight quotes need matching
         self.dialogue_patterns = [
-            r'"([^"]+)"',           # Double quotes
-            r"'([^']+)'",           # Single quotes
-            r'"([^"]+)"',           # Smart quotes
-            r'«([^»]+)»',           # French quotes
+            r'"[^"]+"',             # Double quotes
+            r"'[^']+'",             # Single quotes
         ]
 
+        # Patterns are compiled once here rather than looked up on every call.
+        # Dialogue patterns are fused so one search decides each paragraph.
+        self._dialogue_re = re.compile('|'.join(f'(?:{p})' for p in self.dialogue_patterns))
+
+        # One pass over the text: 3+ line breaks (ignoring trailing spaces),
+        # trailing spaces, then runs of spaces; see _clean_whitespace
+        self._cleanup_re = re.compile(r'((?: *\n){3,})|( +\n)|( +)')
+        self._cleanup_replacements = {1: '\n\n', 2: '\n', 3: ' '}
+
+        self._quote_table = str.maketrans({
+            '\u201c': '"',  # Left double quote
+            '\u201d': '"',  # Right double quote
+            '\u2018': "'",  # Left single quote
+            '\u2019': "'",  # Right single quote
+            '«': '"',
+            '»': '"',
+        })
+
+        self._chapter_re = re.compile(
+            r'^(chapter|ch\.?)\s*(\d+|one|two|three|four|five|six|seven|eight|nine|ten)',
+            re.IGNORECASE
+        )
+        self._scene_break_re = re.compile(r'^[-*#]{3,}$')
+
+        # POV pronouns in one pattern; the named group that matched gives the person
+        self._pov_re = re.compile(
+            r'\b(?:(?P<first>I|me|my|mine|we|us|our)'
+            r'|(?P<second>you|your|yours)'
+            r'|(?P<third>he|she|they|him|her|them|his|hers|their))\b',
+            re.IGNORECASE
+        )
+
     def normalize_file(self, file_path: str) -> Dict[str, any]:
         """
         Load and normalize a story file.
@@ -29,21 +62,20 @@ class StoryNormalizer:
             file_path: Path to story text file
 
         Returns:
-            Dict with normalized text and metadata
+            Dict with normalized text and metadata. The raw text is not
+            kept in memory; re-read it from source_path when needed.
         """
         logger.info(f"Loading story from: {file_path}")
 
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                raw_text = f.read()
-
-            normalized = self.normalize(raw_text)
+                normalized = self.normalize(f.read())
 
             return {
-                "raw_text": raw_text,
                 "normalized_text": normalized["text"],
                 "metadata": normalized["metadata"],
-                "source_file": str(Path(file_path).name)
+                "source_file": str(Path(file_path).name),
+                "source_path": str(file_path)
             }
 
         except FileNotFoundError:
@@ -89,7 +121,7 @@ class StoryNormalizer:
         annotated = self._annotate_dialogue(paragraphs)
 
         # Step 6: Extract metadata
-        metadata = self._extract_metadata(text, structure)
+        metadata = self._extract_metadata(text, structure, paragraphs)
 
         normalized_text = "\n\n".join(annotated)
 
@@ -104,14 +136,10 @@ class StoryNormalizer:
 
     def _clean_whitespace(self, text: str) -> str:
         """Clean excessive whitespace."""
-        # Remove multiple spaces
-        text = re.sub(r' +', ' ', text)
-
-        # Remove trailing whitespace
-        text = re.sub(r' +\n', '\n', text)
-
-        # Normalize line breaks (max 2 consecutive)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        # Normalize line breaks (max 2 consecutive), remove trailing
+        # whitespace and collapse multiple spaces
+        replacements = self._cleanup_replacements
+        text = self._cleanup_re.sub(lambda m: replacements[m.lastindex], text)
 
         # Remove leading/trailing whitespace
         text = text.strip()
@@ -120,20 +148,8 @@ class StoryNormalizer:
 
     def _normalize_quotes(self, text: str) -> str:
         """Normalize various quote styles to standard double quotes."""
-        # Replace smart quotes with standard quotes
-        replacements = {
-            '"': '"',
-            '"': '"',
-            ''': "'",
-            ''': "'",
-            '«': '"',
-            '»': '"',
-        }
-
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-
-        return text
+        # Replace smart quotes with standard quotes in a single pass
+        return text.translate(self._quote_table)
 
     def _split_paragraphs(self, text: str) -> List[str]:
         """Split text into paragraphs."""
@@ -161,21 +177,16 @@ class StoryNormalizer:
             "has_chapters": False
         }
 
-        chapter_pattern = re.compile(
-            r'^(chapter|ch\.?)\s*(\d+|one|two|three|four|five|six|seven|eight|nine|ten)',
-            re.IGNORECASE
-        )
-
-        scene_break_pattern = re.compile(r'^[-*#]{3,}$')
-
         for i, para in enumerate(paragraphs):
+            # Cheap prefix checks skip the regexes for ordinary paragraphs;
+            # both patterns can only match text starting with these prefixes
             # Check for chapter markers
-            if chapter_pattern.match(para):
+            if para[:2].lower() == 'ch' and self._chapter_re.match(para):
                 structure["chapter_markers"].append(i)
                 structure["has_chapters"] = True
 
             # Check for scene breaks
-            if scene_break_pattern.match(para):
+            if para[:1] in ('-', '*', '#') and self._scene_break_re.match(para):
                 structure["scene_breaks"].append(i)
 
         return structure
@@ -190,13 +201,7 @@ class StoryNormalizer:
 
         for para in paragraphs:
             # Check if paragraph contains dialogue
-            has_dialogue = False
-            for pattern in self.dialogue_patterns:
-                if re.search(pattern, para):
-                    has_dialogue = True
-                    break
-
-            if has_dialogue:
+            if self._dialogue_re.search(para):
                 # Mixed or pure dialogue
                 if len(para.strip('"\'')) < len(para) * 0.8:
                     annotated.append(f"[DIALOGUE] {para}")
@@ -207,11 +212,16 @@ class StoryNormalizer:
 
         return annotated
 
-    def _extract_metadata(self, text: str, structure: Dict) -> Dict[str, any]:
-        """Extract metadata from the story."""
+    def _extract_metadata(
+        self,
+        text: str,
+        structure: Dict,
+        paragraphs: List[str]
+    ) -> Dict[str, any]:
+        """Extract metadata from the story, reusing its already-split paragraphs."""
         return {
-            "word_count": len(text.split()),
-            "paragraph_count": len(text.split('\n\n')),
+            "word_count": sum(len(p.split()) for p in paragraphs),
+            "paragraph_count": len(paragraphs),
             "character_count": len(text),
             "has_chapters": structure["has_chapters"],
             "chapter_count": len(structure["chapter_markers"]),
@@ -225,9 +235,10 @@ class StoryNormalizer:
         Returns: "first", "second", or "third"
         """
         # Count POV indicators
-        first_person = len(re.findall(r'\b(I|me|my|mine|we|us|our)\b', text, re.IGNORECASE))
-        second_person = len(re.findall(r'\b(you|your|yours)\b', text, re.IGNORECASE))
-        third_person = len(re.findall(r'\b(he|she|they|him|her|them|his|hers|their)\b', text, re.IGNORECASE))
+        counts = Counter(m.lastgroup for m in self._pov_re.finditer(text))
+        first_person = counts["first"]
+        second_person = counts["second"]
+        third_person = counts["third"]
 
         total = first_person + second_person + third_person
         if total == 0:
@@ -1,36 +1,208 @@
 """Image generation using DALL-E 3 (Stage 2 & 4)."""
 
 import os
+import re
+import json
 import time
+import random
+import base64
+import asyncio
+import threading
+import weakref
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
-from openai import OpenAI
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from openai import OpenAI, AsyncOpenAI, APIConnectionError, RateLimitError
 
 from src.utils.logger import get_logger
 from src.utils.config import get_config
+from src.utils.fs import ensure_dir
+from src.utils.ratelimit import TokenBucket
 
 logger = get_logger("stripsmith.generator")
 
+# Transient API errors worth retrying (APITimeoutError is an APIConnectionError)
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError)
+
+# Upper bound on a single backoff delay, in seconds
+MAX_RETRY_DELAY = 60
+
+# Clients are built with max_retries=0 so _call_with_retries owns retries
+# (and paces each attempt); Batch API calls bypass it and keep SDK retries
+BATCH_MAX_RETRIES = 2
+
+# Image downloads are streamed to disk in chunks of this size
+DOWNLOAD_CHUNK_SIZE = 1 << 16  # 64 KB
+
+# Prompt sanitizer rules (pattern, replacement). Earlier rules win where
+# patterns overlap at the same position.
+_SANITIZE_RULES = (
+    # Dead bodies / violence
+    (r'\bcovered body\b', 'covered figure on the ground'),
+    (r'\bdead body\b', 'figure on the ground'),
+    (r'\bcorpse\b', 'figure'),
+    (r'\bbody\b', 'scene'),
+    (r'\bpulling back the sheet\b', 'examining the scene'),
+    (r'\bexamines the body\b', 'examines the scene'),
+    (r'\bexamining the body\b', 'examining the scene'),
+
+    # Blood / gore
+    (r'\bblood\b', 'dark stains'),
+    (r'\bbleeding\b', 'injured'),
+    (r'\bwounded\b', 'hurt'),
+    (r'\bgore\b', ''),
+
+    # Weapons in threatening contexts
+    (r'\bpointing (?:a )?gun\b', 'holding weapon at side'),
+    (r'\baiming (?:a )?gun\b', 'holding weapon'),
+    (r'\bfiring (?:a )?gun\b', 'in action'),
+    (r'\bshooting\b', 'in conflict'),
+    (r'\bwielding (?:a )?weapon\b', 'holding weapon'),
+
+    # Violence
+    (r'\bkilling\b', 'confronting'),
+    (r'\bmurder\b', 'crime'),
+    (r'\battacking\b', 'confronting'),
+    (r'\bstabbing\b', 'in conflict'),
+    (r'\bbeating\b', 'fighting'),
+)
+
+# All rules fused into one alternation so a prompt is scanned once; the
+# named group that matched (r0, r1, ...) selects the replacement
+_SANITIZE_RE = re.compile(
+    "|".join(f"(?P<r{i}>{pattern})" for i, (pattern, _) in enumerate(_SANITIZE_RULES)),
+    re.IGNORECASE
+)
+_SANITIZE_REPLACEMENTS = {f"r{i}": replacement for i, (_, replacement) in enumerate(_SANITIZE_RULES)}
+
+
+@lru_cache(maxsize=1024)
+def _panel_prompt(
+    description: str,
+    char_descriptions: Tuple[str, ...],
+    camera: str,
+    style: str
+) -> str:
+    """
+    Assemble and sanitize a panel prompt from its hashable parts.
+
+    Cached, so re-rendering a panel (retries, alternate sizes) skips the
+    rebuild and sanitizer pass.
+    """
+    # Add character prompts
+    if char_descriptions:
+        description += f". Characters: {', '.join(char_descriptions)}"
+
+    # Add camera angle and style
+    prompt = f"{style}, {description}, {camera}"
+
+    # Clean up, then sanitize for content policy
+    return _sanitize(" ".join(prompt.split()))
+
+
+@lru_cache(maxsize=1024)
+def _sanitize(prompt: str) -> str:
+    """Replace content-policy-sensitive terms in a prompt (see _SANITIZE_RULES)."""
+    # Replace problematic terms with safe alternatives
+    sanitized = _SANITIZE_RE.sub(lambda m: _SANITIZE_REPLACEMENTS[m.lastgroup], prompt)
+
+    # Clean up double spaces
+    sanitized = " ".join(sanitized.split())
+
+    logger.debug(f"Sanitized prompt: {sanitized}")
+
+    return sanitized
+
+
+# Async HTTP clients shared by every ImageGenerator. httpx clients are bound
+# to the event loop they first run on, so callers that don't supply their own
+# get one pooled client per loop. Only the connection pool is shared: OpenAI
+# wrappers carry a user's API key and live no longer than their generator.
+_loop_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _loop_http_client() -> httpx.AsyncClient:
+    """Get the running event loop's shared async HTTP client, creating it on first use."""
+    loop = asyncio.get_running_loop()
+
+    client = _loop_http_clients.get(loop)
+    if client is None or client.is_closed:
+        max_connections = get_config().get("image.max_connections", 32)
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(600, connect=10),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+        _loop_http_clients[loop] = client
+
+    return client
+
+
+async def aclose_shared_clients():
+    """Close the running event loop's shared async HTTP client, if any."""
+    client = _loop_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class ImageGenerator:
     """Generate images using DALL-E 3 API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize image generator.
 
         Args:
             api_key: OpenAI API key (uses OPENAI_API_KEY env var if None)
+            async_http_client: Shared HTTP client for the async API and
+                image downloads (owned and closed by the caller); if None,
+                a per-event-loop client closed by aclose_shared_clients()
+                is used
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY not found in environment")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = OpenAI(api_key=self.api_key, max_retries=0)
+        self.async_http_client = async_http_client
+
+        # (HTTP client, AsyncOpenAI wrapper) built on first async call
+        self._async_client: Optional[Tuple[httpx.AsyncClient, AsyncOpenAI]] = None
+
+        # Keep-alive pool for sync image downloads, so each panel doesn't
+        # pay a fresh TCP + TLS handshake
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
         self.config = get_config()
 
+        # Paces sync requests below the account's images-per-minute limit;
+        # async callers (the web backend) throttle with their own buckets
+        image_rpm = self.config.get("image.rpm", 50)
+        self.rate_limiter = TokenBucket(image_rpm, image_rpm)
+
         self.total_cost = 0.0
+        self._cost_lock = threading.Lock()
 
         logger.info("Image generator initialized")
 
@@ -55,17 +227,15 @@ class ImageGenerator:
         Returns:
             Dict with image path, URL, and cost
         """
-        # Use config defaults if not specified
-        size = size or self.config.get("image.size", "1024x1024")
-        quality = quality or self.config.get("image.quality", "standard")
-        style = style or self.config.get("image.style", "natural")
+        size, quality, style = self._resolve_image_options(size, quality, style)
 
         logger.info(f"Generating image: {prompt[:60]}...")
         logger.debug(f"Size: {size}, Quality: {quality}, Style: {style}")
 
         try:
             # Call DALL-E 3 API
-            response = self.client.images.generate(
+            response = self._call_with_retries(
+                self.client.images.generate,
                 model="dall-e-3",
                 prompt=prompt,
                 size=size,
@@ -80,24 +250,197 @@ class ImageGenerator:
             # Download image
             self._download_image(image_url, output_path)
 
-            # Calculate cost
-            cost = self._calculate_cost(size, quality)
-            self.total_cost += cost
+            return self._record_image(output_path, image_url, size, quality)
 
-            logger.info(f"Image generated: {output_path} (${cost:.3f})")
+        except Exception as e:
+            logger.error(f"Image generation failed: {e}")
+            raise
 
-            return {
-                "path": output_path,
-                "url": image_url,
-                "cost": cost,
-                "size": size,
-                "quality": quality
-            }
+    async def generate_image_async(
+        self,
+        prompt: str,
+        output_path: str,
+        size: str = None,
+        quality: str = None,
+        style: str = None
+    ) -> Dict[str, any]:
+        """
+        Generate a single image using the async DALL-E 3 client.
+
+        Same arguments and return value as generate_image, but the API call
+        and download never block a thread.
+        """
+        size, quality, style = self._resolve_image_options(size, quality, style)
+
+        logger.info(f"Generating image: {prompt[:60]}...")
+        logger.debug(f"Size: {size}, Quality: {quality}, Style: {style}")
+
+        try:
+            response = await self._call_with_retries_async(
+                self._get_async_client().images.generate,
+                model="dall-e-3",
+                prompt=prompt,
+                size=size,
+                quality=quality,
+                style=style,
+                n=1
+            )
+
+            image_url = response.data[0].url
+
+            await self._download_image_async(image_url, output_path)
+
+            return self._record_image(output_path, image_url, size, quality)
 
         except Exception as e:
             logger.error(f"Image generation failed: {e}")
             raise
 
+    def _call_with_retries(self, request: Callable, **params):
+        """
+        Call a sync API method, retrying transient errors with backoff.
+
+        Each attempt first takes a token from the rate limiter. After
+        processing.retry_attempts retries the last error is raised.
+        """
+        retries = self.config.get("processing.retry_attempts", 3)
+
+        for attempt in range(retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                return request(**params)
+            except RETRYABLE_ERRORS as e:
+                if attempt == retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(f"{type(e).__name__}, retrying in {delay:.1f}s ({attempt + 1}/{retries})")
+                time.sleep(delay)
+
+    async def _call_with_retries_async(self, request: Callable, **params):
+        """Async variant of _call_with_retries (pacing is left to the caller)."""
+        retries = self.config.get("processing.retry_attempts", 3)
+
+        for attempt in range(retries + 1):
+            try:
+                return await request(**params)
+            except RETRYABLE_ERRORS as e:
+                if attempt == retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(f"{type(e).__name__}, retrying in {delay:.1f}s ({attempt + 1}/{retries})")
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        """Exponential backoff with jitter: 1s up to 2^(attempt+1)s, capped."""
+        return random.uniform(1, min(MAX_RETRY_DELAY, 2 ** (attempt + 1)))
+
+    def _resolve_image_options(self, size: str, quality: str, style: str):
+        """Fill unspecified image options from config defaults."""
+        size = size or self.config.get("image.size", "1024x1024")
+        quality = quality or self.config.get("image.quality", "standard")
+        style = style or self.config.get("image.style", "natural")
+        return size, quality, style
+
+    def _record_image(
+        self,
+        output_path: str,
+        image_url: str,
+        size: str,
+        quality: str
+    ) -> Dict[str, any]:
+        """Track cost of a generated image and build its result info."""
+        cost = self._calculate_cost(size, quality)
+        with self._cost_lock:
+            self.total_cost += cost
+
+        logger.info(f"Image generated: {output_path} (${cost:.3f})")
+
+        return {
+            "path": output_path,
+            "url": image_url,
+            "cost": cost,
+            "size": size,
+            "quality": quality
+        }
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        """Get this generator's async OpenAI client on the shared HTTP client."""
+        http_client = self._get_async_http_client()
+
+        # Rebuilt if the shared client changed (e.g. a new event loop)
+        if self._async_client is None or self._async_client[0] is not http_client:
+            self._async_client = (http_client, AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=http_client,
+                max_retries=0
+            ))
+
+        return self._async_client[1]
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        """Get the caller's async HTTP client, or this event loop's shared one."""
+        if self.async_http_client is not None:
+            return self.async_http_client
+        return _loop_http_client()
+
+    def generate_images_batch(
+        self,
+        image_jobs: List[Tuple[str, str]],
+        max_workers: Optional[int] = None
+    ) -> List:
+        """
+        Generate several independent images concurrently.
+
+        DALL-E 3 takes a single prompt per request (n=1), so a batch is a
+        fan-out of up to max_workers generate_image calls sharing the
+        rate limiter and connection pool.
+
+        Args:
+            image_jobs: List of (prompt, output_path) tuples
+            max_workers: Concurrent requests (defaults to image.max_concurrent)
+
+        Returns:
+            Generated image info or the raised exception, in image_jobs order
+        """
+        if not image_jobs:
+            return []
+
+        max_workers = max_workers or self.config.get("image.max_concurrent", 4)
+        max_workers = max(1, min(max_workers, len(image_jobs)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.generate_image, prompt, output_path)
+                for prompt, output_path in image_jobs
+            ]
+
+            outcomes = []
+            for future in futures:
+                try:
+                    outcomes.append(future.result())
+                except Exception as e:
+                    outcomes.append(e)
+
+        return outcomes
+
+    async def generate_images_batch_async(
+        self,
+        image_jobs: List[Tuple[str, str]],
+        max_concurrent: Optional[int] = None
+    ) -> List:
+        """Async variant of generate_images_batch."""
+        sem = asyncio.Semaphore(max_concurrent or self.config.get("image.max_concurrent", 4))
+
+        async def _generate(prompt, output_path):
+            async with sem:
+                return await self.generate_image_async(prompt, output_path)
+
+        return await asyncio.gather(
+            *(_generate(prompt, output_path) for prompt, output_path in image_jobs),
+            return_exceptions=True
+        )
+
     def generate_character_sheet(
         self,
         character_name: str,
@@ -107,6 +450,9 @@ class ImageGenerator:
         """
         Generate character reference sheet images.
 
+        Angles are independent requests, generated together through
+        generate_images_batch.
+
         Args:
             character_name: Character name
             prompts: List of prompt dicts from CharacterTemplateManager
@@ -118,35 +464,55 @@ class ImageGenerator:
         logger.info(f"Generating character sheet for {character_name}...")
 
         # Create output directory
-        char_dir = Path(output_dir) / self._sanitize_filename(character_name)
-        char_dir.mkdir(parents=True, exist_ok=True)
+        char_dir = self.character_sheet_dir(output_dir, character_name)
+        ensure_dir(char_dir)
 
-        generated = []
+        outcomes = self.generate_images_batch([
+            (prompt_data["prompt"], str(char_dir / f"{character_name}_{prompt_data['angle']}.png"))
+            for prompt_data in prompts
+        ])
 
-        for i, prompt_data in enumerate(prompts):
-            angle = prompt_data["angle"]
-            prompt = prompt_data["prompt"]
+        return self._collect_sheet_results(character_name, prompts, outcomes)
 
-            # Generate filename
-            filename = f"{character_name}_{angle}.png"
-            output_path = str(char_dir / filename)
+    async def generate_character_sheet_async(
+        self,
+        character_name: str,
+        prompts: List[Dict[str, str]],
+        output_dir: str
+    ) -> List[Dict[str, any]]:
+        """Async variant of generate_character_sheet."""
+        logger.info(f"Generating character sheet for {character_name}...")
 
-            try:
-                # Generate image
-                result = self.generate_image(prompt, output_path)
-                result["angle"] = angle
-                result["character"] = character_name
+        char_dir = self.character_sheet_dir(output_dir, character_name)
+        ensure_dir(char_dir)
 
-                generated.append(result)
+        outcomes = await self.generate_images_batch_async([
+            (prompt_data["prompt"], str(char_dir / f"{character_name}_{prompt_data['angle']}.png"))
+            for prompt_data in prompts
+        ])
 
-                # Rate limiting
-                if i < len(prompts) - 1:
-                    time.sleep(1)  # Be nice to the API
+        return self._collect_sheet_results(character_name, prompts, outcomes)
+
+    def _collect_sheet_results(
+        self,
+        character_name: str,
+        prompts: List[Dict[str, str]],
+        outcomes: List
+    ) -> List[Dict[str, any]]:
+        """Tag successful sheet images with their angle and log failures."""
+        generated = []
+
+        for prompt_data, outcome in zip(prompts, outcomes):
+            angle = prompt_data["angle"]
 
-            except Exception as e:
-                logger.error(f"Failed to generate {character_name} {angle}: {e}")
+            if isinstance(outcome, BaseException):
+                logger.error(f"Failed to generate {character_name} {angle}: {outcome}")
                 continue
 
+            outcome["angle"] = angle
+            outcome["character"] = character_name
+            generated.append(outcome)
+
         logger.info(f"Generated {len(generated)}/{len(prompts)} images for {character_name}")
 
         return generated
@@ -154,7 +520,7 @@ class ImageGenerator:
     def generate_panel(
         self,
         panel_data: Dict,
-        character_prompts: Dict[str, str],
+        character_prompts: Mapping[str, str],
         output_path: str
     ) -> Dict[str, any]:
         """
@@ -180,113 +546,502 @@ class ImageGenerator:
 
         return result
 
-    def _build_panel_prompt(
+    async def generate_panel_async(
         self,
         panel_data: Dict,
-        character_prompts: Dict[str, str]
-    ) -> str:
-        """Build complete prompt for a comic panel."""
+        character_prompts: Mapping[str, str],
+        output_path: str
+    ) -> Dict[str, any]:
+        """Async variant of generate_panel."""
+        prompt = self._build_panel_prompt(panel_data, character_prompts)
 
-        # Base description
-        description = panel_data.get("description", "")
+        logger.info(f"Generating panel {panel_data.get('panel_num', '?')}: {panel_data.get('description', '')[:50]}...")
 
-        # Add character prompts
-        characters = panel_data.get("characters", [])
-        if characters and character_prompts:
-            char_descriptions = []
-            for char_name in characters:
-                if char_name in character_prompts:
-                    char_descriptions.append(character_prompts[char_name])
+        result = await self.generate_image_async(prompt, output_path)
+        result["panel_num"] = panel_data.get("panel_num")
+        result["description"] = panel_data.get("description")
 
-            if char_descriptions:
-                description += f". Characters: {', '.join(char_descriptions)}"
+        return result
 
-        # Add camera angle
-        camera = panel_data.get("camera_angle", "medium-shot")
-        description += f", {camera}"
+    def generate_panels_batch(
+        self,
+        panel_jobs: List[Tuple],
+        character_prompts: Mapping[str, str],
+        max_workers: Optional[int] = None,
+        on_complete: Optional[Callable[[Tuple, Dict], None]] = None
+    ) -> List[Dict[str, any]]:
+        """
+        Generate comic panels concurrently.
 
-        # Add style
-        style = panel_data.get("style", "comic book art")
-        prompt = f"{style}, {description}"
+        DALL-E 3 only takes one prompt per request, so panels are batched by
+        running up to max_workers generate_panel calls in parallel threads.
 
-        # Clean up
-        prompt = " ".join(prompt.split())
+        Args:
+            panel_jobs: List of (panel_data, output_path, ...) tuples; any
+                extra items are the caller's and are passed to on_complete
+            character_prompts: Dict mapping character names to base prompts
+            max_workers: Concurrent requests (defaults to processing.batch_size)
+            on_complete: Optional callback receiving (panel job, result) as
+                each panel finishes, called from the submitting thread
+
+        Returns:
+            List of generated image info, in panel_jobs order
+        """
+        max_workers = max_workers or self.config.get("processing.batch_size", 5)
+        results = [None] * len(panel_jobs)
 
-        # Sanitize for content policy
-        prompt = self._sanitize_prompt(prompt)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.generate_panel, job[0], character_prompts, str(job[1])): i
+                for i, job in enumerate(panel_jobs)
+            }
+
+            try:
+                for future in as_completed(futures):
+                    i = futures[future]
+                    results[i] = future.result()
 
-        return prompt
+                    if on_complete:
+                        on_complete(panel_jobs[i], results[i])
 
-    def _sanitize_prompt(self, prompt: str) -> str:
+            except Exception:
+                # Don't start panels that haven't been sent yet
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return results
+
+    async def generate_panels_batch_async(
+        self,
+        panel_jobs: List[Tuple[Dict, str]],
+        character_prompts: Mapping[str, str],
+        poll_interval: float = 30,
+        on_poll: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict[str, any]]:
         """
-        Sanitize prompt to avoid DALL-E 3 content policy violations.
+        Generate comic panels through the OpenAI Batch API.
 
-        Replaces explicit violence, death, weapons with safer alternatives.
+        Slower to complete than generate_panel_async but billed at half
+        price and outside the synchronous rate limits.
+
+        Args:
+            panel_jobs: List of (panel_data, output_path) tuples
+            character_prompts: Dict mapping character names to base prompts
+            poll_interval: Seconds between batch status checks
+            on_poll: Optional callback receiving (completed, total) counts
+
+        Returns:
+            List of generated image info
         """
-        # Lowercase for case-insensitive matching
-        sanitized = prompt
-
-        # Replace problematic terms with safe alternatives
-        replacements = {
-            # Dead bodies / violence
-            r'\bcovered body\b': 'covered figure on the ground',
-            r'\bdead body\b': 'figure on the ground',
-            r'\bcorpse\b': 'figure',
-            r'\bbody\b': 'scene',
-            r'\bpulling back the sheet\b': 'examining the scene',
-            r'\bexamines the body\b': 'examines the scene',
-            r'\bexamining the body\b': 'examining the scene',
-
-            # Blood / gore
-            r'\bblood\b': 'dark stains',
-            r'\bbleeding\b': 'injured',
-            r'\bwounded\b': 'hurt',
-            r'\bgore\b': '',
-
-            # Weapons in threatening contexts
-            r'\bpointing (?:a )?gun\b': 'holding weapon at side',
-            r'\baiming (?:a )?gun\b': 'holding weapon',
-            r'\bfiring (?:a )?gun\b': 'in action',
-            r'\bshooting\b': 'in conflict',
-            r'\bwielding (?:a )?weapon\b': 'holding weapon',
-
-            # Violence
-            r'\bkilling\b': 'confronting',
-            r'\bmurder\b': 'crime',
-            r'\battacking\b': 'confronting',
-            r'\bstabbing\b': 'in conflict',
-            r'\bbeating\b': 'fighting',
-        }
+        prompts, output_paths = self._batch_panel_prompts(panel_jobs, character_prompts)
+
+        batch_id = await self.submit_batch_async(prompts)
+
+        return await self.wait_for_batch_async(
+            batch_id,
+            output_paths,
+            poll_interval=poll_interval,
+            on_poll=on_poll
+        )
+
+    def generate_panels_batch_api(
+        self,
+        panel_jobs: List[Tuple[Dict, str]],
+        character_prompts: Mapping[str, str],
+        poll_interval: float = 60,
+        on_poll: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict[str, any]]:
+        """
+        Generate comic panels through the OpenAI Batch API, blocking until done.
+
+        For offline runs: billed at half price and outside the synchronous
+        rate limits, but batches can take up to 24 hours to complete.
+
+        Args:
+            panel_jobs: List of (panel_data, output_path) tuples
+            character_prompts: Dict mapping character names to base prompts
+            poll_interval: Seconds between batch status checks
+            on_poll: Optional callback receiving (completed, total) counts
+
+        Returns:
+            List of generated image info
+        """
+        prompts, output_paths = self._batch_panel_prompts(panel_jobs, character_prompts)
+
+        batch_id = self.submit_batch(prompts)
+
+        return self.wait_for_batch(
+            batch_id,
+            output_paths,
+            poll_interval=poll_interval,
+            on_poll=on_poll
+        )
+
+    def _batch_panel_prompts(
+        self,
+        panel_jobs: List[Tuple[Dict, str]],
+        character_prompts: Mapping[str, str]
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Build prompts and output paths for panel jobs, keyed by custom_id."""
+        prompts = {}
+        output_paths = {}
+        for i, (panel_data, output_path, *_) in enumerate(panel_jobs):
+            custom_id = f"panel_{i}"
+            prompts[custom_id] = self._build_panel_prompt(panel_data, character_prompts)
+            output_paths[custom_id] = str(output_path)
+
+        return prompts, output_paths
+
+    def build_batch_input(
+        self,
+        prompts: Dict[str, str],
+        size: str = None,
+        quality: str = None,
+        style: str = None
+    ) -> bytes:
+        """
+        Build Batch API JSONL input for a set of image prompts.
+
+        Args:
+            prompts: Dict mapping custom_id to image prompt
+            size: Image size (config default if None)
+            quality: Image quality (config default if None)
+            style: Image style (config default if None)
+
+        Returns:
+            JSONL file content
+        """
+        size, quality, style = self._resolve_image_options(size, quality, style)
+
+        lines = []
+        for custom_id, prompt in prompts.items():
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/images/generations",
+                "body": {
+                    "model": "dall-e-3",
+                    "prompt": prompt,
+                    "size": size,
+                    "quality": quality,
+                    "style": style,
+                    "n": 1,
+                    # URLs expire after an hour; batches can take longer
+                    "response_format": "b64_json"
+                }
+            }))
+
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+    def submit_batch(self, prompts: Dict[str, str]) -> str:
+        """
+        Submit image prompts as one OpenAI Batch API job (50% cost).
+
+        Args:
+            prompts: Dict mapping custom_id to image prompt
+
+        Returns:
+            Batch ID
+        """
+        client = self.client.with_options(max_retries=BATCH_MAX_RETRIES)
+
+        batch_file = client.files.create(
+            file=("panels.jsonl", self.build_batch_input(prompts)),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/images/generations",
+            completion_window="24h"
+        )
+
+        logger.info(f"Submitted image batch {batch.id} ({len(prompts)} prompts)")
+        return batch.id
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        output_paths: Dict[str, str],
+        poll_interval: float = 60,
+        on_poll: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict[str, any]]:
+        """
+        Wait for an image batch to finish and write its images to disk.
+
+        Args:
+            batch_id: Batch ID from submit_batch
+            output_paths: Dict mapping custom_id to output image path
+            poll_interval: Seconds between status checks
+            on_poll: Optional callback receiving (completed, total) counts
+
+        Returns:
+            List of generated image info
+        """
+        client = self.client.with_options(max_retries=BATCH_MAX_RETRIES)
+
+        while True:
+            batch = client.batches.retrieve(batch_id)
+            if self._batch_finished(batch, on_poll):
+                break
+            time.sleep(poll_interval)
+
+        content = client.files.content(batch.output_file_id)
+        return self._write_batch_results(content.text, output_paths)
+
+    async def submit_batch_async(self, prompts: Dict[str, str]) -> str:
+        """
+        Submit image prompts as one OpenAI Batch API job (50% cost).
+
+        Args:
+            prompts: Dict mapping custom_id to image prompt
+
+        Returns:
+            Batch ID
+        """
+        client = self._get_async_client().with_options(max_retries=BATCH_MAX_RETRIES)
+
+        batch_file = await client.files.create(
+            file=("panels.jsonl", self.build_batch_input(prompts)),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/images/generations",
+            completion_window="24h"
+        )
+
+        logger.info(f"Submitted image batch {batch.id} ({len(prompts)} prompts)")
+        return batch.id
+
+    async def wait_for_batch_async(
+        self,
+        batch_id: str,
+        output_paths: Dict[str, str],
+        poll_interval: float = 30,
+        on_poll: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict[str, any]]:
+        """
+        Wait for an image batch to finish and write its images to disk.
+
+        Args:
+            batch_id: Batch ID from submit_batch_async
+            output_paths: Dict mapping custom_id to output image path
+            poll_interval: Seconds between status checks
+            on_poll: Optional callback receiving (completed, total) counts
+
+        Returns:
+            List of generated image info
+        """
+        client = self._get_async_client().with_options(max_retries=BATCH_MAX_RETRIES)
+
+        while True:
+            batch = await client.batches.retrieve(batch_id)
+            if self._batch_finished(batch, on_poll):
+                break
+            await asyncio.sleep(poll_interval)
 
-        import re
-        for pattern, replacement in replacements.items():
-            sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
+        content = await client.files.content(batch.output_file_id)
+        return self._write_batch_results(content.text, output_paths)
 
-        # Clean up double spaces
-        sanitized = " ".join(sanitized.split())
+    @staticmethod
+    def _batch_finished(batch, on_poll: Optional[Callable[[int, int], None]] = None) -> bool:
+        """
+        Check a polled batch, reporting progress.
+
+        Returns:
+            True once the batch has completed with output
+
+        Raises:
+            RuntimeError: If the batch failed, expired, was cancelled, or
+                completed without an output file
+        """
+        if on_poll and batch.request_counts:
+            on_poll(batch.request_counts.completed, batch.request_counts.total)
+
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"Image batch {batch.id} {batch.status}")
+        if batch.status != "completed":
+            return False
+        if not batch.output_file_id:
+            raise RuntimeError(f"Image batch {batch.id} produced no output")
+
+        return True
+
+    def _write_batch_results(
+        self,
+        output_jsonl: str,
+        output_paths: Dict[str, str]
+    ) -> List[Dict[str, any]]:
+        """Decode Batch API output lines and save each image by custom_id."""
+        size, quality, _ = self._resolve_image_options(None, None, None)
+
+        generated = []
+
+        for line in output_jsonl.splitlines():
+            if not line.strip():
+                continue
+
+            entry = json.loads(line)
+            custom_id = entry["custom_id"]
+            response = entry.get("response") or {}
+
+            if entry.get("error") or response.get("status_code") != 200:
+                logger.error(f"Batch request {custom_id} failed: {entry.get('error') or response.get('body')}")
+                continue
 
-        logger.debug(f"Sanitized prompt: {sanitized}")
+            output_path = output_paths[custom_id]
+            ensure_dir(Path(output_path).parent)
+            data = base64.b64decode(response["body"]["data"][0]["b64_json"])
+            self._write_image_file(output_path, [data], len(data))
 
-        return sanitized
+            # Batch API is billed at half price
+            cost = self._calculate_cost(size, quality) * 0.5
+            with self._cost_lock:
+                self.total_cost += cost
+
+            generated.append({
+                "path": output_path,
+                "cost": cost,
+                "size": size,
+                "quality": quality,
+                "custom_id": custom_id
+            })
+
+        logger.info(f"Batch complete: {len(generated)}/{len(output_paths)} images saved")
+
+        return generated
+
+    def _build_panel_prompt(
+        self,
+        panel_data: Dict,
+        character_prompts: Mapping[str, str]
+    ) -> str:
+        """Build complete prompt for a comic panel."""
+
+        # Only look up the characters in this panel, not the whole cast
+        char_descriptions = ()
+        characters = panel_data.get("characters", [])
+        if characters and character_prompts:
+            char_descriptions = tuple(
+                char_prompt
+                for char_prompt in map(character_prompts.get, characters)
+                if char_prompt
+            )
+
+        return _panel_prompt(
+            panel_data.get("description", ""),
+            char_descriptions,
+            panel_data.get("camera_angle", "medium-shot"),
+            panel_data.get("style", "comic book art")
+        )
+
+    def _sanitize_prompt(self, prompt: str) -> str:
+        """
+        Sanitize prompt to avoid DALL-E 3 content policy violations.
+
+        Replaces explicit violence, death, weapons with safer alternatives.
+        """
+        return _sanitize(prompt)
 
     def _download_image(self, url: str, output_path: str):
         """Download image from URL to file."""
         try:
             # Create parent directory
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            ensure_dir(Path(output_path).parent)
 
-            # Download image
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+            # Download image, streaming it to disk rather than buffering it
+            with self.http.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+
+                # Save to file
+                self._write_image_file(
+                    output_path,
+                    response.iter_content(DOWNLOAD_CHUNK_SIZE),
+                    int(response.headers.get("Content-Length") or 0)
+                )
+
+        except Exception as e:
+            logger.error(f"Failed to download image: {e}")
+            raise
+
+    async def _download_image_async(self, url: str, output_path: str):
+        """Stream an image from URL to file without blocking the event loop."""
+        try:
+            ensure_dir(Path(output_path).parent)
 
-            # Save to file
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+            await self._stream_image_async(self._get_async_http_client(), url, output_path)
 
         except Exception as e:
             logger.error(f"Failed to download image: {e}")
             raise
 
+    async def _stream_image_async(self, client: httpx.AsyncClient, url: str, output_path: str):
+        """Write a streamed response to disk chunk by chunk as it arrives."""
+        async with client.stream("GET", url, timeout=30) as response:
+            response.raise_for_status()
+
+            size = int(response.headers.get("Content-Length") or 0)
+            fd = self._open_image_file(output_path, size)
+            try:
+                total = 0
+                async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    total += self._write_chunk(fd, chunk)
+
+                if size and total != size:
+                    os.ftruncate(fd, total)
+            finally:
+                os.close(fd)
+
+    def _write_image_file(self, output_path: str, chunks: Iterable[bytes], size: int = 0):
+        """
+        Write image bytes to disk in one pass.
+
+        When the final size is known the file is preallocated to it first
+        (where the OS supports it) so the filesystem can lay it out
+        contiguously instead of extending it as writes arrive.
+
+        Args:
+            output_path: Path to save the image
+            chunks: Image data, in order
+            size: Total size in bytes (0 if unknown)
+        """
+        fd = self._open_image_file(output_path, size)
+        try:
+            total = 0
+            for chunk in chunks:
+                total += self._write_chunk(fd, chunk)
+
+            # Don't leave preallocated space behind if the size hint was off
+            if size and total != size:
+                os.ftruncate(fd, total)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _open_image_file(output_path: str, size: int = 0) -> int:
+        """Open an image file for writing, preallocating size bytes if known."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(output_path, flags, 0o644)
+
+        if size and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, size)
+            except OSError:
+                pass  # Filesystem doesn't support preallocation
+
+        return fd
+
+    @staticmethod
+    def _write_chunk(fd: int, chunk: bytes) -> int:
+        """Write a whole chunk to fd, returning its length."""
+        view = memoryview(chunk)
+        length = len(view)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        return length
+
     def _calculate_cost(self, size: str, quality: str) -> float:
         """Calculate cost for DALL-E 3 generation."""
         # DALL-E 3 pricing
@@ -298,6 +1053,10 @@ class ImageGenerator:
 
         return costs.get(size, {}).get(quality, 0.040)
 
+    def character_sheet_dir(self, output_dir: str, character_name: str) -> Path:
+        """Get the directory a character's reference sheet is written to."""
+        return Path(output_dir) / self._sanitize_filename(character_name)
+
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize character name for filename."""
         # Remove special characters
@@ -311,5 +1070,6 @@ class ImageGenerator:
 
     def reset_cost_tracking(self):
         """Reset cost tracking."""
-        self.total_cost = 0.0
+        with self._cost_lock:
+            self.total_cost = 0.0
         logger.info("Cost tracking reset")
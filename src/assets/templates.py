@@ -1,11 +1,44 @@
 """Character prompt template management for consistency."""
 
-from typing import Dict, List
+import re
+from functools import lru_cache
+from string import Formatter
+from typing import Callable, Dict, List, Tuple
 from src.utils.logger import get_logger
 from src.utils.config import get_config
 
 logger = get_logger("stripsmith.templates")
 
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=8)
+def _compile_template(template_format: str) -> Callable[[Dict], str]:
+    """
+    Parse a character template once into a render function.
+
+    Templates made only of plain {field} placeholders render by joining
+    literal text and looked-up values; anything fancier (format specs,
+    conversions, attribute access) falls back to str.format_map.
+    """
+    parsed = list(Formatter().parse(template_format))
+
+    if any(
+        field is not None and (spec or conversion or not field.isidentifier())
+        for _, field, spec, conversion in parsed
+    ):
+        return template_format.format_map
+
+    def render(data: Dict) -> str:
+        parts = []
+        for literal, field, _, _ in parsed:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(data[field]))
+        return "".join(parts)
+
+    return render
+
 
 class CharacterTemplateManager:
     """Manage character prompt templates for consistent generation."""
@@ -15,6 +48,9 @@ class CharacterTemplateManager:
         self.config = get_config()
         self.templates = {}
 
+        # Reference sheet prompts by (character, angles); cleared when templates change
+        self._sheet_prompt_cache: Dict[Tuple[str, Tuple[str, ...]], List[Dict[str, str]]] = {}
+
     def create_template(self, character: Dict, style: Dict) -> str:
         """
         Create a prompt template for a character.
@@ -45,12 +81,13 @@ class CharacterTemplateManager:
         }
 
         # Format template
-        prompt = template_format.format(**template_data)
+        prompt = _compile_template(template_format)(template_data)
 
         # Clean up empty fields
-        prompt = " ".join(prompt.split())  # Remove extra spaces
+        prompt = _WS_RE.sub(" ", prompt).strip()  # Remove extra spaces
 
         # Store template
+        self._sheet_prompt_cache.clear()
         self.templates[character["name"]] = {
             "base_prompt": prompt,
             "template_data": template_data,
@@ -135,11 +172,16 @@ class CharacterTemplateManager:
             angles: List of angles to generate (default: front, 3/4, profile)
 
         Returns:
-            List of prompt dicts with angle and prompt
+            List of prompt dicts with angle and prompt (cached; don't modify)
         """
         if angles is None:
             angles = ["front", "3/4", "profile"]
 
+        cache_key = (character_name, tuple(angles))
+        cached = self._sheet_prompt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         prompts = []
 
         for angle in angles:
@@ -158,6 +200,7 @@ class CharacterTemplateManager:
 
         logger.info(f"Created {len(prompts)} reference sheet prompts for {character_name}")
 
+        self._sheet_prompt_cache[cache_key] = prompts
         return prompts
 
     def get_negative_prompt(self, character_name: str = None) -> str:
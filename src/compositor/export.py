@@ -1,18 +1,28 @@
 """Export comic pages to various formats."""
 
 import os
+import shutil
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from PIL import Image
 from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
 from src.utils.logger import get_logger
 from src.utils.config import get_config
+from src.utils.fs import ensure_dir
 
 logger = get_logger("stripsmith.export")
 
 
+def _export_workers(page_count: int) -> int:
+    """Thread count for per-page export work."""
+    return max(1, min(os.cpu_count() or 1, page_count))
+
+
 class ComicExporter:
     """Export comic pages to PDF, PNG, or CBZ format."""
 
@@ -42,7 +52,7 @@ class ComicExporter:
 
         try:
             # Create PDF
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            ensure_dir(Path(output_path).parent)
             c = canvas.Canvas(output_path, pagesize=letter)
 
             # Set metadata
@@ -53,11 +63,11 @@ class ComicExporter:
             for i, img_path in enumerate(page_images):
                 logger.debug(f"Adding page {i+1}/{len(page_images)}")
 
-                # Open image
-                img = Image.open(img_path)
+                # Open image once; reportlab draws from the same reader
+                img = ImageReader(img_path)
 
                 # Get dimensions
-                img_width, img_height = img.size
+                img_width, img_height = img.getSize()
 
                 # Calculate scaling to fit page
                 page_width, page_height = letter
@@ -72,7 +82,7 @@ class ComicExporter:
 
                 # Add image
                 c.drawImage(
-                    img_path,
+                    img,
                     x, y,
                     width=scaled_width,
                     height=scaled_height,
@@ -113,22 +123,28 @@ class ComicExporter:
         logger.info(f"Exporting {len(page_images)} pages to {output_dir}...")
 
         try:
-            os.makedirs(output_dir, exist_ok=True)
+            ensure_dir(output_dir)
 
-            output_paths = []
+            def save_one(item):
+                i, img_path = item
 
-            for i, img_path in enumerate(page_images):
                 # Create output filename
                 output_filename = f"{prefix}_{i+1:03d}.png"
                 output_path = os.path.join(output_dir, output_filename)
 
-                # Copy image
-                img = Image.open(img_path)
-                img.save(output_path, 'PNG')
-
-                output_paths.append(output_path)
+                # Copy image; PNG pages are copied byte-for-byte
+                if str(img_path).lower().endswith('.png'):
+                    shutil.copyfile(img_path, output_path)
+                else:
+                    with Image.open(img_path) as img:
+                        img.save(output_path, 'PNG')
 
                 logger.debug(f"Exported: {output_filename}")
+                return output_path
+
+            # File copies and PIL re-encodes release the GIL, so pages run in parallel
+            with ThreadPoolExecutor(max_workers=_export_workers(len(page_images))) as executor:
+                output_paths = list(executor.map(save_one, enumerate(page_images)))
 
             logger.info(f"Images exported to: {output_dir}")
             return output_paths
@@ -140,28 +156,40 @@ class ComicExporter:
     def export_to_cbz(
         self,
         page_images: List[str],
-        output_path: str
+        output_path: str,
+        compress_level: Optional[int] = None
     ) -> str:
         """
         Export to CBZ (Comic Book ZIP) format.
 
+        Pages are stored uncompressed by default: PNG data is already
+        deflated, so re-compressing costs CPU for almost no size saving.
+
         Args:
             page_images: List of page image paths
             output_path: Output CBZ path
+            compress_level: Deflate level 1-9, or 0 to store pages
+                (defaults to export.cbz_compress_level)
 
         Returns:
             Path to generated CBZ
         """
-        import zipfile
-
         logger.info(f"Exporting {len(page_images)} pages to CBZ...")
 
+        if compress_level is None:
+            compress_level = self.config.get("export.cbz_compress_level")
+
+        if compress_level:
+            compression = zipfile.ZIP_DEFLATED
+        else:
+            compression, compress_level = zipfile.ZIP_STORED, None
+
         try:
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            ensure_dir(Path(output_path).parent)
 
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as cbz:
+            with zipfile.ZipFile(output_path, 'w', compression, compresslevel=compress_level) as cbz:
                 for i, img_path in enumerate(page_images):
-                    # Add with sequential filename
+                    # Add with sequential filename; streamed from disk, one page at a time
                     arcname = f"page_{i+1:03d}.png"
                     cbz.write(img_path, arcname)
 
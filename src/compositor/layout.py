@@ -1,15 +1,144 @@
 """Page layout and panel composition (Stage 5)."""
 
-import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
+import PIL
 from PIL import Image, ImageDraw, ImageFont
 
 from src.utils.logger import get_logger
 from src.utils.config import get_config
+from src.utils.fs import ensure_dir
 
 logger = get_logger("stripsmith.layout")
 
+# Panel border style
+BORDER_COLOR = (0, 0, 0)
+BORDER_WIDTH = 3
+
+RESAMPLE_FILTERS = {
+    "lanczos": Image.Resampling.LANCZOS,
+    "bicubic": Image.Resampling.BICUBIC,
+    "bilinear": Image.Resampling.BILINEAR,
+}
+
+
+@lru_cache(maxsize=1)
+def _check_pillow_build():
+    """Log the Pillow build once per process; Pillow-SIMD versions carry a .post suffix."""
+    if ".post" in PIL.__version__:
+        logger.info(f"Using Pillow-SIMD {PIL.__version__}")
+    else:
+        # Stock Pillow is the normal setup, so this is only a hint
+        logger.debug(
+            f"Using stock Pillow {PIL.__version__}; "
+            "install pillow-simd for faster panel resizing and PNG encoding"
+        )
+
+
+@lru_cache(maxsize=8)
+def _resample_filter(name: str) -> int:
+    """Map a layout.resample name to a Pillow filter, warning once per bad value."""
+    resample = RESAMPLE_FILTERS.get(str(name).lower())
+    if resample is None:
+        logger.warning(
+            f"Unknown layout.resample {name!r} (expected one of: "
+            f"{', '.join(RESAMPLE_FILTERS)}); using lanczos"
+        )
+        resample = RESAMPLE_FILTERS["lanczos"]
+    return resample
+
+
+@lru_cache(maxsize=8)
+def _load_font(size: int) -> ImageFont.ImageFont:
+    """Load the overlay font once per size, falling back to PIL's default."""
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+Position = Tuple[int, int, int, int]
+
+
+def _grid3(count: int, width: int, height: int, margin: int, gutter: int) -> Tuple[Position, ...]:
+    """3 equal rows."""
+    panel_height = (height - (2 * gutter)) // 3
+    return tuple(
+        (margin, margin + (i * (panel_height + gutter)), width, panel_height)
+        for i in range(min(3, count))
+    )
+
+
+def _grid2x2(count: int, width: int, height: int, margin: int, gutter: int) -> Tuple[Position, ...]:
+    """2x2 grid, filled row by row."""
+    panel_width = (width - gutter) // 2
+    panel_height = (height - gutter) // 2
+    return tuple(
+        (
+            margin + ((i % 2) * (panel_width + gutter)),
+            margin + ((i // 2) * (panel_height + gutter)),
+            panel_width,
+            panel_height
+        )
+        for i in range(min(4, count))
+    )
+
+
+def _splash(count: int, width: int, height: int, margin: int, gutter: int) -> Tuple[Position, ...]:
+    """Full page."""
+    return ((margin, margin, width, height),)
+
+
+def _webtoon(count: int, width: int, height: int, margin: int, gutter: int) -> Tuple[Position, ...]:
+    """Vertical stack of up to 6 panels, no gutters."""
+    panel_height = height // min(count, 6)
+    return tuple(
+        (margin, margin + (i * panel_height), width, panel_height)
+        for i in range(min(6, count))
+    )
+
+
+# Layout name -> position function(count, usable_width, usable_height, margin, gutter)
+_LAYOUT_FNS = {
+    "3-panel-grid": _grid3,
+    "4-panel-grid": _grid2x2,
+    "splash": _splash,
+    "webtoon": _webtoon,
+}
+
+
+@lru_cache(maxsize=32)
+def _panel_positions(
+    layout: str,
+    panel_count: int,
+    page_width: int,
+    page_height: int,
+    gutter: int,
+    margin: int
+) -> Tuple[Position, ...]:
+    """
+    Calculate panel positions for a layout on a page.
+
+    Pages that share a layout and panel count reuse one result.
+
+    Returns:
+        Tuple of (x, y, width, height) tuples
+    """
+    layout_fn = _LAYOUT_FNS.get(layout)
+    if layout_fn is None:
+        # Default: 3-panel grid
+        logger.warning(f"Unknown layout: {layout}, using 3-panel-grid")
+        layout_fn = _grid3
+
+    return layout_fn(
+        panel_count,
+        page_width - (2 * margin),
+        page_height - (2 * margin),
+        margin,
+        gutter
+    )
+
 
 class PageCompositor:
     """Compose comic pages from panel images."""
@@ -24,7 +153,9 @@ class PageCompositor:
         )
         self.gutter = self.config.get("layout.gutter_width", 10)
         self.margin = self.config.get("layout.page_margin", 20)
+        self.resample = _resample_filter(self.config.get("layout.resample", "lanczos"))
 
+        _check_pillow_build()
         logger.info(f"Page compositor initialized: {self.page_width}x{self.page_height}")
 
     def compose_page(
@@ -58,8 +189,9 @@ class PageCompositor:
         # Place panels
         for i, (panel_path, position) in enumerate(zip(panel_images, positions)):
             try:
-                panel_img = Image.open(panel_path)
-                panel_img = self._resize_panel(panel_img, position)
+                # Each panel is used once, so it's decoded, placed and freed
+                with Image.open(panel_path) as panel_img:
+                    panel_img = self._resize_panel(panel_img, position)
                 page.paste(panel_img, (position[0], position[1]))
 
                 logger.debug(f"Placed panel {i+1} at {position}")
@@ -72,7 +204,7 @@ class PageCompositor:
         self._draw_panel_borders(page, positions)
 
         # Save page
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        ensure_dir(Path(output_path).parent)
         page.save(output_path, 'PNG', dpi=(300, 300))
 
         logger.info(f"Page saved: {output_path}")
@@ -82,74 +214,18 @@ class PageCompositor:
         self,
         layout: str,
         panel_count: int
-    ) -> List[Tuple[int, int, int, int]]:
+    ) -> Tuple[Tuple[int, int, int, int], ...]:
         """
         Calculate panel positions for layout.
 
         Returns:
-            List of (x, y, width, height) tuples
+            Tuple of (x, y, width, height) tuples
         """
-        positions = []
-
-        usable_width = self.page_width - (2 * self.margin)
-        usable_height = self.page_height - (2 * self.margin)
-
-        if layout == "3-panel-grid":
-            # 3 equal rows
-            panel_height = (usable_height - (2 * self.gutter)) // 3
-
-            for i in range(min(3, panel_count)):
-                y = self.margin + (i * (panel_height + self.gutter))
-                positions.append((
-                    self.margin,
-                    y,
-                    usable_width,
-                    panel_height
-                ))
-
-        elif layout == "4-panel-grid":
-            # 2x2 grid
-            panel_width = (usable_width - self.gutter) // 2
-            panel_height = (usable_height - self.gutter) // 2
-
-            for row in range(2):
-                for col in range(2):
-                    if len(positions) >= panel_count:
-                        break
-
-                    x = self.margin + (col * (panel_width + self.gutter))
-                    y = self.margin + (row * (panel_height + self.gutter))
-
-                    positions.append((x, y, panel_width, panel_height))
-
-        elif layout == "splash":
-            # Full page
-            positions.append((
-                self.margin,
-                self.margin,
-                usable_width,
-                usable_height
-            ))
-
-        elif layout == "webtoon":
-            # Vertical stack
-            panel_height = usable_height // min(panel_count, 6)
-
-            for i in range(min(6, panel_count)):
-                y = self.margin + (i * panel_height)
-                positions.append((
-                    self.margin,
-                    y,
-                    usable_width,
-                    panel_height
-                ))
-
-        else:
-            # Default: 3-panel grid
-            logger.warning(f"Unknown layout: {layout}, using 3-panel-grid")
-            return self._calculate_panel_positions("3-panel-grid", panel_count)
-
-        return positions
+        return _panel_positions(
+            layout, panel_count,
+            self.page_width, self.page_height,
+            self.gutter, self.margin
+        )
 
     def _resize_panel(
         self,
@@ -160,9 +236,17 @@ class PageCompositor:
         target_width = position[2]
         target_height = position[3]
 
+        # Same aspect and no upscaling needed: one resize fills the slot exactly
+        if (
+            panel.mode == 'RGB'
+            and panel.width >= target_width
+            and abs(panel.width / panel.height - target_width / target_height) < 1e-3
+        ):
+            return panel.resize((target_width, target_height), self.resample)
+
         # Resize maintaining aspect ratio
         panel_resized = panel.copy()
-        panel_resized.thumbnail((target_width, target_height), Image.Resampling.LANCZOS)
+        panel_resized.thumbnail((target_width, target_height), self.resample)
 
         # Create centered version if aspect ratios don't match
         result = Image.new('RGB', (target_width, target_height), 'white')
@@ -178,20 +262,18 @@ class PageCompositor:
     def _draw_panel_borders(
         self,
         page: Image.Image,
-        positions: List[Tuple[int, int, int, int]]
+        positions: Tuple[Tuple[int, int, int, int], ...]
     ):
         """Draw borders around panels."""
-        draw = ImageDraw.Draw(page)
-
-        for pos in positions:
-            x, y, w, h = pos
+        # Same pixels as draw.rectangle([(x, y), (x + w, y + h)], width=3),
+        # but as four solid fills per panel with no drawing state
+        for x, y, w, h in positions:
+            right, bottom = x + w + 1, y + h + 1
 
-            # Draw rectangle border
-            draw.rectangle(
-                [(x, y), (x + w, y + h)],
-                outline='black',
-                width=3
-            )
+            page.paste(BORDER_COLOR, (x, y, right, y + BORDER_WIDTH))
+            page.paste(BORDER_COLOR, (x, bottom - BORDER_WIDTH, right, bottom))
+            page.paste(BORDER_COLOR, (x, y, x + BORDER_WIDTH, bottom))
+            page.paste(BORDER_COLOR, (right - BORDER_WIDTH, y, right, bottom))
 
     def add_text_overlay(
         self,
@@ -216,11 +298,7 @@ class PageCompositor:
         draw = ImageDraw.Draw(page)
 
         # Load font
-        try:
-            font_size = self.config.get("bubbles.font_size", 14)
-            font = ImageFont.truetype("arial.ttf", font_size)
-        except:
-            font = ImageFont.load_default()
+        font = _load_font(self.config.get("bubbles.font_size", 14))
 
         # Add text for each panel (simplified - just caption text at bottom)
         # Full speech bubble implementation would be Phase 2
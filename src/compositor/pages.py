@@ -0,0 +1,71 @@
+"""Page composition planning for generated panels."""
+
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+
+class PagePlan:
+    """
+    Map chapter breakdowns to page and panel jobs.
+
+    global_panel_num restarts at 1 in every chapter, so panels are tracked
+    by the index of the page they belong to, and their image files are
+    named by chapter and panel number.
+    """
+
+    def __init__(
+        self,
+        breakdowns: List[Dict],
+        panels_dir: Union[str, Path],
+        pages_dir: Union[str, Path]
+    ):
+        """
+        Plan the pages for a set of chapter breakdowns.
+
+        Args:
+            breakdowns: Panel breakdowns, in chapter order
+            panels_dir: Directory for generated panel images
+            pages_dir: Directory for composed pages
+        """
+        panels_dir = Path(panels_dir)
+        pages_dir = Path(pages_dir)
+
+        # (page data, panel image paths, output path) per page
+        self.page_jobs: List[Tuple[Dict, List[str], str]] = []
+
+        # (panel data, image path, page index) per panel
+        self.panel_jobs: List[Tuple[Dict, Path, int]] = []
+
+        for breakdown in breakdowns:
+            chapter_num = breakdown['chapter_number']
+
+            for page in breakdown['pages']:
+                page_idx = len(self.page_jobs)
+
+                panel_paths = [
+                    panels_dir / f"chapter_{chapter_num}_panel_{p['global_panel_num']:03d}.png"
+                    for p in page['panels']
+                ]
+                self.panel_jobs.extend(
+                    (panel, path, page_idx)
+                    for panel, path in zip(page['panels'], panel_paths)
+                )
+
+                output_path = pages_dir / f"chapter_{chapter_num}_page_{page['page_number']}.png"
+                self.page_jobs.append((page, [str(p) for p in panel_paths], str(output_path)))
+
+        # Panels not yet generated, per page
+        self.panels_remaining = [len(page['panels']) for page, _, _ in self.page_jobs]
+
+    def panel_done(self, page_idx: int) -> bool:
+        """
+        Record a finished panel.
+
+        Args:
+            page_idx: Page index from the panel's job
+
+        Returns:
+            True if this was the page's last outstanding panel
+        """
+        self.panels_remaining[page_idx] -= 1
+        return self.panels_remaining[page_idx] == 0
@@ -1,40 +1,160 @@
 """Chapter to panel breakdown using Claude (Stage 3)."""
 
+import hashlib
+import importlib.util
 import json
+import logging
 import os
-from typing import Dict, List, Optional
-from anthropic import Anthropic
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import httpx
+from anthropic import Anthropic, APIConnectionError, APIStatusError, RateLimitError
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
 
 from src.utils.logger import get_logger
 from src.utils.config import get_config
+from src.utils.fs import ensure_dir, write_atomic
+from src.utils import jsonio
+from src.utils.ratelimit import TokenBucket, estimate_tokens
 
 logger = get_logger("stripsmith.breakdown")
 
+# Per-chapter tail of the breakdown prompt; everything before it is shared
+CHAPTER_PROMPT_TEMPLATE = """Chapter: {title}
+Summary: {summary}
+
+Text:
+{text}
+
+Return ONLY the JSON, no additional text."""
+
+# Shape of a breakdown response. Only fields the pipeline reads are
+# type-checked; anything else the model adds passes through unchecked
+PANEL_DATA_SCHEMA = {
+    "type": "object",
+    "required": ["pages"],
+    "properties": {
+        "pages": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["panels"],
+                "properties": {
+                    "page_number": {"type": ["integer", "string"]},
+                    "layout": {"type": "string"},
+                    "panels": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "description": {"type": "string"},
+                                "dialogue": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "object",
+                                        "required": ["speaker", "text"],
+                                        "properties": {
+                                            "speaker": {"type": "string"},
+                                            "text": {"type": "string"}
+                                        }
+                                    }
+                                },
+                                "characters": {"type": "array", "items": {"type": "string"}},
+                                "camera_angle": {"type": "string"}
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+# Checked once at import; validating against it is then a single call
+_PANEL_DATA_VALIDATOR = Draft7Validator(PANEL_DATA_SCHEMA)
+
+# HTTP/2 multiplexes concurrent chapter requests over one TLS connection;
+# it needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Pool for the client PanelBreakdown creates when none is shared with it
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=300)
+
+# Upper bound on a single backoff delay, in seconds
+MAX_RETRY_DELAY = 30
+
+# The client is built with max_retries=0 so _create_message owns retries;
+# Message Batches calls bypass it and keep the SDK's retries
+BATCH_MAX_RETRIES = 2
+
+# Raw breakdown responses keyed by a hash of the model and prompt
+BREAKDOWN_CACHE_DIR = Path("data/cache/breakdown")
+
 
 class PanelBreakdown:
     """Break chapters into comic panels with dialogue and layout."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.Client] = None,
+        rate_limiter: Optional[TokenBucket] = None
+    ):
         """
         Initialize panel breakdown.
 
         Args:
             api_key: Anthropic API key
+            http_client: Shared HTTP client to reuse pooled connections (optional)
+            rate_limiter: Caller's text tokens-per-minute bucket, shared with
+                its other Claude calls (defaults to one sized by analysis.tpm)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment")
 
-        self.client = Anthropic(api_key=self.api_key)
+        if http_client is None:
+            # Kept for the instance's lifetime so every chapter reuses warm connections
+            http_client = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                limits=HTTP_LIMITS,
+                timeout=httpx.Timeout(600, connect=10)
+            )
+
+        # Retries are handled by _create_message so they share the rate limiter
+        self.client = Anthropic(api_key=self.api_key, http_client=http_client, max_retries=0)
         self.config = get_config()
 
+        # Paces chapter requests across all worker threads below the
+        # account's input+output tokens-per-minute limit
+        if rate_limiter is None:
+            tpm = self.config.get("analysis.tpm", 40000)
+            rate_limiter = TokenBucket(tpm, tpm)
+        self.rate_limiter = rate_limiter
+
+        # The instructions are the same for every chapter, so build them once
+        self._instructions_block = {"type": "text", "text": self._build_breakdown_instructions()}
+
+        # Project context blocks by (character names, art style)
+        self._context_blocks: Dict[Tuple[Tuple[str, ...], str], Dict] = {}
+
+        # (story_text, paragraph offsets) for the last story seen
+        self._offsets_cache: Optional[Tuple[str, List[int]]] = None
+
         logger.info("Panel breakdown initialized")
 
     def breakdown_chapter(
         self,
         chapter: Dict,
         story_text: str,
-        project_spec: Dict
+        project_spec: Dict,
+        force_refresh: bool = False,
+        context_block: Optional[Dict] = None
     ) -> Dict:
         """
         Break down a chapter into panels.
@@ -43,88 +163,327 @@ class PanelBreakdown:
             chapter: Chapter data from project spec
             story_text: Full story text
             project_spec: Project specification with characters and style
+            force_refresh: Call the API even if an identical request's
+                response is cached (caching requires processing.cache_enabled)
+            context_block: Prebuilt project context from
+                _project_context_block (derived from project_spec if omitted)
 
         Returns:
             Panel breakdown with pages and panels
         """
         chapter_num = chapter["number"]
-        logger.info(f"Breaking down chapter {chapter_num}...")
-
-        # Extract chapter text
-        chapter_text = self._extract_chapter_text(chapter, story_text)
-
-        # Build breakdown prompt
-        prompt = self._build_breakdown_prompt(chapter, chapter_text, project_spec)
+        logger.info("Breaking down chapter %s...", chapter_num)
 
         # Call Claude API
         try:
-            response = self.client.messages.create(
-                model=self.config.get("analysis.llm_model", "claude-3-5-sonnet-20250514"),
-                max_tokens=4096,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
+            params = self._build_request_params(chapter, story_text, project_spec, context_block)
+
+            cache_path = None
+            if self.config.get("processing.cache_enabled", True):
+                # Model, prompt and all other request parameters
+                cache_key = hashlib.blake2b(jsonio.dumps(params), digest_size=16).hexdigest()
+                cache_path = BREAKDOWN_CACHE_DIR / f"{cache_key}.txt"
+
+            cache_hit = cache_path is not None and not force_refresh and cache_path.exists()
+            if cache_hit:
+                logger.info("Breakdown cache hit for chapter %s: %s", chapter_num, cache_path)
+                result_text = cache_path.read_text(encoding='utf-8')
+            else:
+                response = self._create_message(params)
+                result_text = response.content[0].text
 
             # Parse response
-            result_text = response.content[0].text
             panel_data = self._parse_response(result_text)
 
-            # Add chapter info
-            panel_data["chapter_number"] = chapter_num
-            panel_data["chapter_title"] = chapter.get("title", f"Chapter {chapter_num}")
+            # Only cache fresh responses that parsed
+            if cache_path is not None and not cache_hit:
+                self._store_cached_response(result_text, cache_path)
 
-            logger.info(f"Chapter {chapter_num}: {len(panel_data['pages'])} pages, "
-                       f"{sum(len(p['panels']) for p in panel_data['pages'])} panels")
-
-            return panel_data
+            return self._finish_breakdown(panel_data, chapter)
 
         except Exception as e:
-            logger.error(f"Panel breakdown failed: {e}")
+            logger.error("Panel breakdown failed: %s", e)
             raise
 
+    def _create_message(self, params: Dict):
+        """
+        Call messages.create, retrying transient errors with backoff.
+
+        Each attempt first takes its estimated tokens from the rate limiter.
+        Rate limits, connection errors and 5xx responses are retried up to
+        processing.retry_attempts times; the last error is then raised.
+        """
+        retries = self.config.get("processing.retry_attempts", 3)
+        prompt_text = "".join(block["text"] for block in params["messages"][0]["content"])
+        tokens = estimate_tokens(prompt_text, params["max_tokens"])
+
+        for attempt in range(retries + 1):
+            self.rate_limiter.acquire(tokens)
+            try:
+                return self.client.messages.create(**params)
+            except (RateLimitError, APIConnectionError, APIStatusError) as e:
+                if attempt == retries or not self._is_retryable(e):
+                    raise
+                delay = random.uniform(1, min(MAX_RETRY_DELAY, 2 ** (attempt + 1)))
+                logger.warning("%s, retrying in %.1fs (%s/%s)", type(e).__name__, delay, attempt + 1, retries)
+                time.sleep(delay)
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Whether an API error is transient (429, 5xx/overloaded, or connection)."""
+        if isinstance(error, (RateLimitError, APIConnectionError)):
+            return True
+        return isinstance(error, APIStatusError) and error.status_code >= 500
+
+    def _store_cached_response(self, result_text: str, cache_path: Path):
+        """Write a raw response to the breakdown cache atomically (best effort)."""
+        try:
+            ensure_dir(cache_path.parent)
+            write_atomic(cache_path, result_text.encode('utf-8'))
+        except OSError as e:
+            logger.warning("Failed to cache breakdown: %s", e)
+
+    def breakdown_chapters_batch(
+        self,
+        chapters: List[Dict],
+        story_text: str,
+        project_spec: Dict,
+        poll_interval: float = 30,
+        on_poll: Optional[Callable[[int, int], None]] = None,
+        fallback: bool = True
+    ) -> List[Dict]:
+        """
+        Break down several chapters with one Message Batches request.
+
+        Batches are billed at half price and avoid per-request rate
+        limits, but may take much longer to complete.
+
+        Args:
+            chapters: Chapter data from project spec
+            story_text: Full story text
+            project_spec: Project specification with characters and style
+            poll_interval: Seconds between batch status checks
+            on_poll: Optional callback receiving (processed, total) counts
+            fallback: If the batch can't be created, break the chapters down
+                with direct concurrent requests (breakdown_all_chapters)
+                instead of raising
+
+        Returns:
+            Panel breakdowns for the chapters that succeeded, in chapter order
+        """
+        try:
+            batch = self._submit_chapter_batch(chapters, story_text, project_spec)
+        except Exception as e:
+            if not fallback:
+                raise
+            logger.warning("Batch submission failed, breaking down chapters directly: %s", e)
+            return self.breakdown_all_chapters(project_spec, story_text, chapters=chapters)
+
+        return self._collect_chapter_batch(batch, chapters, poll_interval, on_poll)
+
+    def _submit_chapter_batch(
+        self,
+        chapters: List[Dict],
+        story_text: str,
+        project_spec: Dict
+    ):
+        """Create a Message Batches request with one breakdown per chapter."""
+        logger.info("Submitting batch breakdown for %s chapters...", len(chapters))
+
+        context_block = self._project_context_block(project_spec)
+        requests = [
+            {
+                "custom_id": f"chapter-{i}",
+                "params": self._build_request_params(chapter, story_text, project_spec, context_block)
+            }
+            for i, chapter in enumerate(chapters)
+        ]
+
+        return self._batches().create(requests=requests)
+
+    def _collect_chapter_batch(
+        self,
+        batch,
+        chapters: List[Dict],
+        poll_interval: float,
+        on_poll: Optional[Callable[[int, int], None]]
+    ) -> List[Dict]:
+        """Wait for a chapter batch to end and parse its results in chapter order."""
+        while True:
+            if on_poll:
+                counts = batch.request_counts
+                processed = counts.succeeded + counts.errored + counts.canceled + counts.expired
+                on_poll(processed, len(chapters))
+
+            if batch.processing_status == "ended":
+                break
+
+            time.sleep(poll_interval)
+            batch = self._batches().retrieve(batch.id)
+
+        panel_data_by_id = {}
+        for entry in self._batches().results(batch.id):
+            if entry.result.type != "succeeded":
+                logger.error("Batch breakdown %s %s", entry.custom_id, entry.result.type)
+                continue
+
+            try:
+                panel_data_by_id[entry.custom_id] = self._parse_response(
+                    entry.result.message.content[0].text
+                )
+            except Exception as e:
+                logger.error("Failed to parse batch breakdown %s: %s", entry.custom_id, e)
+
+        breakdowns = []
+        for i, chapter in enumerate(chapters):
+            panel_data = panel_data_by_id.get(f"chapter-{i}")
+            if panel_data is not None:
+                breakdowns.append(self._finish_breakdown(panel_data, chapter))
+
+        logger.info("Batch breakdown complete: %s/%s chapters", len(breakdowns), len(chapters))
+
+        return breakdowns
+
+    def _batches(self):
+        """Message Batches resource on a client that keeps SDK retries."""
+        return self.client.with_options(max_retries=BATCH_MAX_RETRIES).messages.batches
+
+    def _build_request_params(
+        self,
+        chapter: Dict,
+        story_text: str,
+        project_spec: Dict,
+        context_block: Optional[Dict] = None
+    ) -> Dict:
+        """Build Messages API parameters for a chapter breakdown."""
+        # Extract chapter text
+        chapter_text = self._extract_chapter_text(chapter, story_text)
+
+        # Build breakdown prompt
+        prompt = self._build_breakdown_prompt(chapter, chapter_text, project_spec, context_block)
+
+        return {
+            "model": self.config.get("analysis.llm_model", "claude-3-5-sonnet-20250514"),
+            "max_tokens": 4096,
+            "messages": [{
+                "role": "user",
+                "content": prompt
+            }]
+        }
+
+    def _finish_breakdown(self, panel_data: Dict, chapter: Dict) -> Dict:
+        """Attach chapter info to parsed panel data."""
+        chapter_num = chapter["number"]
+
+        # Add chapter info
+        panel_data["chapter_number"] = chapter_num
+        panel_data["chapter_title"] = chapter.get("title", f"Chapter {chapter_num}")
+
+        # Counting panels walks every page, so skip it when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Chapter %s: %s pages, %s panels",
+                chapter_num,
+                len(panel_data['pages']),
+                sum(len(p['panels']) for p in panel_data['pages'])
+            )
+
+        return panel_data
+
     def _extract_chapter_text(self, chapter: Dict, story_text: str) -> str:
         """Extract text for a specific chapter."""
-        # Split story into paragraphs
-        paragraphs = story_text.split('\n\n')
+        # Paragraph start offsets, plus one past the end
+        offsets = self._paragraph_offsets(story_text)
+        paragraph_count = len(offsets) - 1
 
-        # Get chapter paragraphs
-        start = chapter.get("start_paragraph", 0)
-        end = chapter.get("end_paragraph", len(paragraphs))
+        # Get chapter paragraphs (list slice semantics)
+        start, end, _ = slice(
+            chapter.get("start_paragraph", 0),
+            chapter.get("end_paragraph", paragraph_count)
+        ).indices(paragraph_count)
 
-        chapter_paras = paragraphs[start:end]
-        chapter_text = "\n\n".join(chapter_paras)
+        if start >= end:
+            return ""
 
-        return chapter_text
+        # One slice of the story instead of splitting and re-joining it
+        return story_text[offsets[start]:offsets[end] - 2]
+
+    def _paragraph_offsets(self, story_text: str) -> List[int]:
+        """
+        Get the offset of each '\\n\\n'-separated paragraph in story_text.
+
+        Computed once per story and reused for every chapter. The list
+        ends with len(story_text) + 2, as if the text ended in a separator.
+        """
+        cached = self._offsets_cache
+        if cached is not None and cached[0] is story_text:
+            return cached[1]
+
+        offsets = [0]
+        pos = story_text.find('\n\n')
+        while pos != -1:
+            offsets.append(pos + 2)
+            pos = story_text.find('\n\n', pos + 2)
+        offsets.append(len(story_text) + 2)
+
+        self._offsets_cache = (story_text, offsets)
+        return offsets
 
     def _build_breakdown_prompt(
         self,
         chapter: Dict,
         chapter_text: str,
-        project_spec: Dict
-    ) -> str:
-        """Build the panel breakdown prompt."""
-
-        characters = project_spec.get("characters", [])
-        character_names = [c["name"] for c in characters]
+        project_spec: Dict,
+        context_block: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        Build the panel breakdown prompt as message content blocks.
 
-        style = project_spec.get("style", {})
-        art_style = style.get("art_style", "comic book")
+        The instructions and project context are identical for every
+        chapter, so they come first; only the final chapter block varies
+        between requests.
+        """
+        if context_block is None:
+            context_block = self._project_context_block(project_spec)
+
+        chapter_prompt = CHAPTER_PROMPT_TEMPLATE.format(
+            title=chapter.get('title', ''),
+            summary=chapter.get('summary', ''),
+            text=chapter_text
+        )
+
+        return [
+            self._instructions_block,
+            context_block,
+            {"type": "text", "text": chapter_prompt}
+        ]
+
+    def _project_context_block(self, project_spec: Dict) -> Dict:
+        """
+        Get the character and art style block for a project.
 
-        max_characters = self.config.get("characters.max_per_panel", 3)
-        target_panels = self.config.get("panels.target_panels_per_page", 3)
+        Callers processing many chapters build it once and pass it along;
+        equal projects share one block object.
+        """
+        character_names = tuple(c["name"] for c in project_spec.get("characters", []))
+        art_style = project_spec.get("style", {}).get("art_style", "comic book")
 
-        prompt = f"""Break down this chapter into comic book panels for visual storytelling.
+        context_key = (character_names, art_style)
+        context_block = self._context_blocks.get(context_key)
+        if context_block is None:
+            context_block = self._context_blocks[context_key] = {
+                "type": "text",
+                "text": f"Known Characters: {', '.join(character_names)}\nArt Style: {art_style}"
+            }
 
-Chapter: {chapter.get('title', '')}
-Summary: {chapter.get('summary', '')}
+        return context_block
 
-Text:
-{chapter_text}
+    def _build_breakdown_instructions(self) -> str:
+        """Build the chapter-independent part of the breakdown prompt."""
+        max_characters = self.config.get("characters.max_per_panel", 3)
+        target_panels = self.config.get("panels.target_panels_per_page", 3)
 
-Known Characters: {', '.join(character_names)}
-Art Style: {art_style}
+        return f"""Break down the chapter below into comic book panels for visual storytelling.
 
 Please provide a JSON response with the following structure:
 
@@ -171,10 +530,7 @@ Instructions:
 Visual Description Guidelines:
 - Include: lighting, expressions, body language, background details
 - Example: "Detective Sarah stands in the rain-soaked alley, her green eyes narrowed, hand on her holster. Neon signs reflect in puddles behind her."
-
-Return ONLY the JSON, no additional text."""
-
-        return prompt
+"""
 
     def _parse_response(self, response_text: str) -> Dict:
         """Parse Claude's JSON response."""
@@ -187,85 +543,140 @@ Return ONLY the JSON, no additional text."""
                 raise ValueError("No JSON found in response")
 
             json_text = response_text[json_start:json_end]
-            panel_data = json.loads(json_text)
+            panel_data = jsonio.loads(json_text)
 
             # Validate structure
-            if "pages" not in panel_data:
-                raise ValueError("Missing 'pages' in response")
+            error = best_match(_PANEL_DATA_VALIDATOR.iter_errors(panel_data))
+            if error is not None:
+                location = "/".join(str(p) for p in error.absolute_path) or "response"
+                raise ValueError(f"Invalid breakdown at {location}: {error.message}")
 
             # Assign global panel numbers
-            global_panel_num = 1
-            for page in panel_data["pages"]:
-                for panel in page.get("panels", []):
-                    panel["global_panel_num"] = global_panel_num
-                    global_panel_num += 1
+            all_panels = chain.from_iterable(page["panels"] for page in panel_data["pages"])
+            for global_panel_num, panel in enumerate(all_panels, start=1):
+                panel["global_panel_num"] = global_panel_num
 
             return panel_data
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.debug(f"Response text: {response_text}")
+        except json.JSONDecodeError as e:  # Also raised by orjson (a subclass)
+            logger.error("Failed to parse JSON response: %s", e)
+            logger.debug("Response text: %s", response_text)
             raise
         except Exception as e:
-            logger.error(f"Failed to parse response: {e}")
+            logger.error("Failed to parse response: %s", e)
             raise
 
     def breakdown_all_chapters(
         self,
         project_spec: Dict,
-        story_text: str
+        story_text: str,
+        chapters: Optional[List[Dict]] = None,
+        on_complete: Optional[Callable[[Dict], None]] = None
     ) -> List[Dict]:
         """
         Break down all chapters in the project.
 
+        Each chapter is an independent API call, so up to
+        processing.max_concurrent_chapters run at once on the shared client.
+
         Args:
             project_spec: Project specification
             story_text: Full story text
+            chapters: Chapters to process (defaults to all in project_spec)
+            on_complete: Optional callback receiving each breakdown as it
+                finishes, called from the submitting thread
 
         Returns:
-            List of panel breakdowns for each chapter
+            List of panel breakdowns for each chapter, in chapter order
         """
-        chapters = project_spec.get("chapters", [])
-        logger.info(f"Breaking down {len(chapters)} chapters...")
+        if chapters is None:
+            chapters = project_spec.get("chapters", [])
+        logger.info("Breaking down %s chapters...", len(chapters))
 
-        all_breakdowns = []
+        results: List[Optional[Dict]] = [None] * len(chapters)
+        max_workers = max(1, min(self.config.get("processing.max_concurrent_chapters", 8), len(chapters)))
 
-        for chapter in chapters:
-            try:
-                breakdown = self.breakdown_chapter(chapter, story_text, project_spec)
-                all_breakdowns.append(breakdown)
+        # Character names and art style are the same for every chapter
+        context_block = self._project_context_block(project_spec)
 
-            except Exception as e:
-                logger.error(f"Failed to break down chapter {chapter.get('number', '?')}: {e}")
-                continue
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.breakdown_chapter, chapter, story_text, project_spec,
+                    context_block=context_block
+                ): i
+                for i, chapter in enumerate(chapters)
+            }
+
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+
+                except Exception as e:
+                    logger.error("Failed to break down chapter %s: %s", chapters[i].get('number', '?'), e)
+                    continue
+
+                if on_complete:
+                    on_complete(results[i])
 
-        logger.info(f"Completed breakdown for {len(all_breakdowns)}/{len(chapters)} chapters")
+        all_breakdowns = [breakdown for breakdown in results if breakdown is not None]
+
+        logger.info("Completed breakdown for %s/%s chapters", len(all_breakdowns), len(chapters))
 
         return all_breakdowns
 
     def save_breakdown(self, breakdown: Dict, output_path: str):
         """Save panel breakdown to JSON file."""
         try:
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            ensure_dir(Path(output_path).parent)
+
+            write_atomic(output_path, jsonio.dumps(breakdown, indent=True))
+
+            logger.info("Panel breakdown saved to: %s", output_path)
+
+        except Exception as e:
+            logger.error("Failed to save breakdown: %s", e)
+            raise
+
+    def save_all(self, breakdowns: List[Dict], out_dir: str) -> List[str]:
+        """
+        Save several chapter breakdowns into one directory.
+
+        The directory is created once, then each breakdown is written as
+        chapter_<number>_panels.json.
+
+        Args:
+            breakdowns: Panel breakdowns to save
+            out_dir: Output directory
+
+        Returns:
+            Paths of the saved files, in input order
+        """
+        try:
+            out_dir = ensure_dir(out_dir)
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(breakdown, f, indent=2, ensure_ascii=False)
+            output_paths = []
+            for breakdown in breakdowns:
+                output_path = out_dir / f"chapter_{breakdown['chapter_number']}_panels.json"
+                write_atomic(output_path, jsonio.dumps(breakdown, indent=True))
+                output_paths.append(str(output_path))
 
-            logger.info(f"Panel breakdown saved to: {output_path}")
+            logger.info("Saved %s panel breakdowns to: %s", len(output_paths), out_dir)
+            return output_paths
 
         except Exception as e:
-            logger.error(f"Failed to save breakdown: {e}")
+            logger.error("Failed to save breakdowns: %s", e)
             raise
 
     def load_breakdown(self, input_path: str) -> Dict:
         """Load panel breakdown from JSON file."""
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                breakdown = json.load(f)
+            breakdown = jsonio.load_file(input_path)
 
-            logger.info(f"Panel breakdown loaded from: {input_path}")
+            logger.info("Panel breakdown loaded from: %s", input_path)
             return breakdown
 
         except Exception as e:
-            logger.error(f"Failed to load breakdown: {e}")
+            logger.error("Failed to load breakdown: %s", e)
             raise
@@ -1,20 +1,36 @@
 """Configuration loader for Stripsmith."""
 
+import copy
 import os
 import yaml
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+# libyaml's C loader when available (several times faster than pure Python)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed config files by resolved path, with the (mtime, size) they were parsed at
+_parse_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Marks keys known to be absent in Config's lookup cache
+_MISSING = object()
 
 
 class Config:
     """Configuration manager for Stripsmith."""
 
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        config_data: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize configuration.
 
         Args:
             config_path: Path to config.yaml file. If None, uses default.
+            config_data: Already-parsed config to use instead of reading
+                config_path (e.g. in tests)
         """
         if config_path is None:
             # Default to config/config.yaml in project root
@@ -22,14 +38,30 @@ class Config:
             config_path = project_root / "config" / "config.yaml"
 
         self.config_path = Path(config_path)
-        self._config = self._load_config()
+        self._config = config_data if config_data is not None else self._load_config()
+
+        # Resolved dot-path lookups; cleared whenever the config changes
+        self._cache: Dict[str, Any] = {}
 
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
+        """
+        Load configuration from YAML file.
+
+        Files are parsed once per process and re-parsed only when their
+        mtime or size changes; each Config gets its own copy to mutate.
+        """
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            return config or {}
+            path = self.config_path.resolve()
+            st = os.stat(path)
+            stamp = (st.st_mtime_ns, st.st_size)
+
+            cached = _parse_cache.get(path)
+            if cached is None or cached[0] != stamp:
+                with open(path, 'rb') as f:
+                    config = yaml.load(f, Loader=_YAML_LOADER) or {}
+                cached = _parse_cache[path] = (stamp, config)
+
+            return copy.deepcopy(cached[1])
         except FileNotFoundError:
             print(f"Warning: Config file not found at {self.config_path}")
             return {}
@@ -53,14 +85,22 @@ class Config:
             >>> config.get("image.size")
             "1024x1024"
         """
-        keys = key.split('.')
+        try:
+            value = self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self._lookup(key)
+
+        return default if value is _MISSING else value
+
+    def _lookup(self, key: str) -> Any:
+        """Walk the config for a dot-notation key (_MISSING if absent)."""
         value = self._config
 
-        for k in keys:
+        for k in key.split('.'):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
 
         return value
 
@@ -81,6 +121,7 @@ class Config:
             config = config[k]
 
         config[keys[-1]] = value
+        self._cache.clear()
 
     def save(self):
         """Save current configuration back to file."""
@@ -0,0 +1,60 @@
+"""Filesystem helpers for Stripsmith."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Set, Union
+
+# Directories this process has already created (or found existing)
+_created_dirs: Set[Path] = set()
+
+
+def ensure_dir(path: Union[str, Path]) -> Path:
+    """
+    Create a directory (and parents) once per process.
+
+    Repeat calls for the same path skip the mkdir syscall, which matters
+    on hot paths that save one file per panel or page.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        The directory as a Path
+    """
+    path = Path(path)
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path)
+    return path
+
+
+def write_atomic(path: Union[str, Path], data: bytes):
+    """
+    Write bytes to a file so readers never see a partial write.
+
+    Data goes to a temp file in the same directory, which then replaces
+    the target in one rename.
+
+    Args:
+        path: Destination file path
+        data: File contents
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+    try:
+        fd = os.open(tmp_path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+        os.replace(tmp_path, path)
+
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
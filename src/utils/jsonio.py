@@ -0,0 +1,79 @@
+"""Fast JSON serialization for Stripsmith data files."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+
+    Uses orjson when installed, falling back to the stdlib json module.
+
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Parse JSON bytes or text.
+
+    Args:
+        data: Encoded JSON
+
+    Returns:
+        Decoded data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file.
+
+    The file is read unbuffered into one buffer sized from fstat, which
+    the parser consumes without an intermediate copy.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Decoded data
+    """
+    with open(path, 'rb', buffering=0) as f:
+        buf = bytearray(os.fstat(f.fileno()).st_size)
+        view = memoryview(buf)
+        total = 0
+        while total < len(buf):
+            n = f.readinto(view[total:])
+            if not n:
+                break  # File shrank while reading
+            total += n
+        view.release()
+
+    if total < len(buf):
+        del buf[total:]
+
+    return loads(buf)
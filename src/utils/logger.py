@@ -1,15 +1,22 @@
 """Logging utilities for Stripsmith."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from colorama import Fore, Style, init
 
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
 
+# Background listeners writing each configured logger's records, by logger name
+_listeners: Dict[str, QueueListener] = {}
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colored output."""
 
@@ -21,12 +28,23 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': Fore.RED + Style.BRIGHT,
     }
 
+    def __init__(self, *args, **kwargs):
+        """Initialize formatter and its colored level names."""
+        super().__init__(*args, **kwargs)
+        self._colored = {
+            level: f"{color}{level}{Style.RESET_ALL}"
+            for level, color in self.COLORS.items()
+        }
+
     def format(self, record):
         """Format log record with colors."""
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{Style.RESET_ALL}"
-        return super().format(record)
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            # Other handlers see the same record; don't leak the color codes
+            record.levelname = levelname
 
 
 def setup_logger(
@@ -52,6 +70,9 @@ def setup_logger(
 
     # Remove existing handlers
     logger.handlers.clear()
+    _stop_listener(name)
+
+    handlers = []
 
     # Console handler with colors
     if console:
@@ -62,7 +83,7 @@ def setup_logger(
             '%(levelname)s | %(message)s'
         )
         console_handler.setFormatter(console_format)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File handler (no colors)
     if log_file:
@@ -77,11 +98,39 @@ def setup_logger(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Worker threads only enqueue records; a background thread does the
+    # console and file writes, so logging never blocks on handler locks or IO
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = listener
+
+        logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
 
+def _stop_listener(name: str):
+    """Flush and stop a logger's background listener, if it has one."""
+    listener = _listeners.pop(name, None)
+    if listener is None:
+        return
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_all_listeners():
+    """Flush queued records before the interpreter exits."""
+    for name in list(_listeners):
+        _stop_listener(name)
+
+
 def get_logger(name: str = "stripsmith") -> logging.Logger:
     """
     Get existing logger instance.
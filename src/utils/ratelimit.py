@@ -0,0 +1,118 @@
+"""Proactive rate limiting for OpenAI/Anthropic calls."""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at a per-minute rate.
+
+    Blocking counterpart of AsyncTokenBucket for threaded callers.
+    """
+
+    def __init__(self, rate_per_min: float, capacity: float):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate_per_min: Tokens added per minute (e.g. RPM or TPM limit)
+            capacity: Maximum tokens held (burst size)
+        """
+        self.rate_per_sec = rate_per_min / 60.0
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1):
+        """
+        Block until the requested tokens are available, then consume them.
+
+        Args:
+            tokens: Tokens to consume (clamped to capacity)
+        """
+        tokens = min(tokens, self.capacity)
+
+        with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                time.sleep((tokens - self._tokens) / self.rate_per_sec)
+
+    def _refill(self):
+        """Add tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate_per_sec
+        )
+        self._updated = now
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket refilled continuously at a per-minute rate.
+
+    Callers wait up front for capacity instead of hitting a 429 and
+    backing off. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate_per_min: float, capacity: float):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate_per_min: Tokens added per minute (e.g. RPM or TPM limit)
+            capacity: Maximum tokens held (burst size)
+        """
+        self.rate_per_sec = rate_per_min / 60.0
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1):
+        """
+        Wait until the requested tokens are available, then consume them.
+
+        Args:
+            tokens: Tokens to consume (clamped to capacity)
+        """
+        tokens = min(tokens, self.capacity)
+
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                await asyncio.sleep((tokens - self._tokens) / self.rate_per_sec)
+
+    def _refill(self):
+        """Add tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate_per_sec
+        )
+        self._updated = now
+
+
+def estimate_tokens(text: str, max_output_tokens: int = 0) -> int:
+    """
+    Roughly estimate tokens a request will count against a TPM limit.
+
+    Args:
+        text: Prompt text (~4 characters per token)
+        max_output_tokens: Requested max_tokens for the response
+
+    Returns:
+        Estimated token count
+    """
+    return len(text) // 4 + max_output_tokens
@@ -0,0 +1,7 @@
+"""Shared pytest setup."""
+
+import sys
+from pathlib import Path
+
+# Make `src` importable when pytest is run from any directory
+sys.path.insert(0, str(Path(__file__).parent.parent))
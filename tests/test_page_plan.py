@@ -0,0 +1,72 @@
+"""Tests for page composition planning."""
+
+import pytest
+
+from src.compositor.pages import PagePlan
+
+
+def _breakdown(chapter_number, panels_per_page):
+    """Build a breakdown whose global_panel_num restarts at 1, like _parse_response."""
+    pages = []
+    panel_num = 1
+    for page_number, count in enumerate(panels_per_page, start=1):
+        panels = []
+        for _ in range(count):
+            panels.append({"global_panel_num": panel_num})
+            panel_num += 1
+        pages.append({"page_number": page_number, "panels": panels})
+
+    return {"chapter_number": chapter_number, "pages": pages}
+
+
+@pytest.fixture
+def two_chapters():
+    return [_breakdown(1, [3, 2]), _breakdown(2, [2, 3])]
+
+
+def test_panel_jobs_carry_their_page(tmp_path, two_chapters):
+    plan = PagePlan(two_chapters, tmp_path / "panels", tmp_path / "pages")
+
+    assert len(plan.page_jobs) == 4
+    assert [page_idx for _, _, page_idx in plan.panel_jobs] == [0, 0, 0, 1, 1, 2, 2, 3, 3, 3]
+
+    # Panel numbers repeat across chapters; image paths must not
+    paths = [path for _, path, _ in plan.panel_jobs]
+    assert len(set(paths)) == len(paths)
+
+    for page_idx, (page, panel_images, _) in enumerate(plan.page_jobs):
+        assert panel_images == [
+            str(path) for _, path, idx in plan.panel_jobs if idx == page_idx
+        ]
+
+
+def test_non_batch_path_composes_every_page_once(tmp_path, two_chapters):
+    pytest.importorskip("openai")
+    pytest.importorskip("requests")
+    pytest.importorskip("httpx")
+    from src.assets.generator import ImageGenerator
+
+    plan = PagePlan(two_chapters, tmp_path / "panels", tmp_path / "pages")
+    generator = ImageGenerator(api_key="test-key")
+
+    done_paths = set()
+
+    def fake_generate_panel(panel_data, character_prompts, output_path):
+        done_paths.add(output_path)
+        return {"path": output_path}
+
+    generator.generate_panel = fake_generate_panel
+
+    composed = []
+
+    def on_complete(job, result):
+        _, _, page_idx = job
+        if plan.panel_done(page_idx):
+            # Every panel of the page exists by the time it's composed
+            assert set(plan.page_jobs[page_idx][1]) <= done_paths
+            composed.append(page_idx)
+
+    generator.generate_panels_batch(plan.panel_jobs, {}, max_workers=4, on_complete=on_complete)
+
+    assert sorted(composed) == [0, 1, 2, 3]
+    assert plan.panels_remaining == [0, 0, 0, 0]